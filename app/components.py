@@ -1,6 +1,79 @@
-import pandas as pd
+from datetime import datetime
+from typing import Optional, Tuple
+
 import streamlit as st
 
+from runelog import get_tracker
+
+
+# Cached data loaders
+#
+# Streamlit re-executes the whole page script on every widget interaction, so
+# reads from the tracker are cached to avoid rescanning the filesystem on each
+# rerun. The leading underscore on `_tracker` tells Streamlit not to hash it.
+
+
+def get_cached_tracker():
+    """Returns a tracker instance shared across the reruns of a session.
+
+    Trackers cache indexes and run data without locking, so each session gets
+    its own instead of sharing one between the threads of concurrent
+    sessions. A session's reruns run one at a time.
+    """
+    if "tracker" not in st.session_state:
+        st.session_state.tracker = get_tracker()
+    return st.session_state.tracker
+
+
+@st.cache_data(ttl=30)
+def experiment_options(_tracker):
+    """Returns the experiment IDs and a mapping of ID to name for selectboxes.
+
+    The IDs are a tuple, so the options passed to the widget are identical
+    across reruns.
+    """
+    experiments = _tracker.list_experiments()
+    ids = tuple(exp["experiment_id"] for exp in experiments)
+    names = {exp["experiment_id"]: exp["name"] for exp in experiments}
+    return ids, names
+
+
+@st.cache_data(ttl=30)
+def load_results(
+    _tracker, experiment_id: str, columns: Optional[Tuple[str, ...]] = None
+):
+    """Cached wrapper around `tracker.load_results()`.
+
+    `columns` is a tuple, so each selection of columns is cached separately.
+    """
+    return _tracker.load_results(
+        experiment_id, columns=list(columns) if columns is not None else None
+    )
+
+
+@st.cache_data(ttl=300, max_entries=128)
+def get_run_details(_tracker, run_id: str):
+    """Cached wrapper around `tracker.get_run_details()`.
+
+    Details are cached per run for longer than the listings, since a run
+    rarely changes once it has been selected. The entry count is bounded so
+    browsing many runs doesn't grow the cache without limit.
+    """
+    return _tracker.get_run_details(run_id)
+
+
+@st.cache_data(ttl=30)
+def list_registered_models(_tracker):
+    """Cached wrapper around `tracker.list_registered_models()`."""
+    return _tracker.list_registered_models()
+
+
+@st.cache_data(ttl=30)
+def get_model_versions(_tracker, model_name: str):
+    """Cached wrapper around `tracker.get_model_versions()`."""
+    return _tracker.get_model_versions(model_name)
+
+
 def render_sidebar_footer():
     """
     A reusable component to create a footer in the sidebar,
@@ -42,12 +115,45 @@ def render_sidebar():
         st.markdown("A lightweight ML experiment tracker.")
         st.divider()
 
-        st.page_link("pages/explorer.py", label="Experiment Explorer", icon="🔬")
-        st.page_link("pages/registry.py", label="Model Registry", icon="📚")
+        st.page_link("views/explorer.py", label="Experiment Explorer", icon="🔬")
+        st.page_link("views/registry.py", label="Model Registry", icon="📚")
+        st.divider()
+
+        if st.button("🔄 Refresh", help="Reload experiments and models from disk."):
+            st.cache_data.clear()
 
         render_sidebar_footer()
 
 
+def render_metrics_and_params(details, heading="#### {}"):
+    """
+    A reusable component to display a run's metrics and parameters side by side.
+    """
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(heading.format("Metrics"))
+        metrics = details.get("metrics", {})
+        if metrics:
+            metrics_rows = [
+                {"Metric": key, "Value": round(value, 4)}
+                for key, value in metrics.items()
+            ]
+            st.dataframe(metrics_rows, hide_index=True, use_container_width=True)
+        else:
+            st.info("No metrics logged.")
+
+    with col2:
+        st.markdown(heading.format("Parameters"))
+        params = details.get("params", {})
+        if params:
+            st.table(
+                [{"Parameter": key, "Value": str(value)} for key, value in params.items()]
+            )
+        else:
+            st.info("No parameters logged.")
+
+
 def display_version_details(tracker, version_info):
     """
     A reusable component to display the details for a model version inside an expander.
@@ -81,31 +187,10 @@ def display_version_details(tracker, version_info):
     st.markdown(f"Source Run ID: `{source_run_id}`")
 
     if source_run_id:
-        run_details = tracker.get_run_details(source_run_id)
+        run_details = get_run_details(tracker, source_run_id)
 
         if run_details:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("**Metrics**")
-                metrics = run_details.get("metrics", {})
-                if metrics:
-                    for key, value in metrics.items():
-                        st.metric(label=key, value=f"{value:.4f}")
-                else:
-                    st.info("No metrics logged.")
-
-            with col2:
-                st.markdown("**Parameters**")
-                params = run_details.get("params", {})
-                if params:
-                    params_df = pd.DataFrame(
-                        params.items(), columns=["Parameter", "Value"]
-                    )
-                    params_df["Value"] = params_df["Value"].astype(str)
-                    st.table(params_df)
-                else:
-                    st.info("No parameters logged.")
+            render_metrics_and_params(run_details, heading="**{}**")
 
             st.markdown("**Source Artifacts**")
             artifacts = run_details.get("artifacts", [])
@@ -116,7 +201,9 @@ def display_version_details(tracker, version_info):
 
     timestamp_str = version_info.get("registration_timestamp")
     if timestamp_str:
-        dt_object = __import__("datetime").datetime.fromisoformat(timestamp_str)
+        # Versions registered by earlier releases have naive local timestamps,
+        # which astimezone() leaves as they are
+        dt_object = datetime.fromisoformat(timestamp_str).astimezone()
         formatted_timestamp = dt_object.strftime("%B %d, %Y, %I:%M %p")
         st.text(f"Registered on: {formatted_timestamp}")
     else:
@@ -0,0 +1,154 @@
+"""Filter expressions for the runs table of the Experiment Explorer.
+
+Expressions such as `accuracy > 0.9 and param_alpha == 0.5` are typed by
+whoever can reach the UI, so they are parsed with `ast` and evaluated here
+instead of with `DataFrame.query()` or `eval()`, which run attribute access
+and method calls. Only comparisons of columns with constants, combined with
+`and`, `or` and `not`, are accepted. Column names that aren't identifiers can
+be quoted with backticks, e.g. `` `val-loss` < 0.2 ``.
+"""
+
+import ast
+import operator
+import re
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_QUOTED_COLUMN = re.compile(r"`([^`]+)`")
+
+
+def _parse(expression: str) -> Tuple[ast.expr, Dict[str, str]]:
+    """Parses an expression, replacing backtick-quoted columns by identifiers.
+
+    Returns:
+        The expression's AST and the column of each placeholder identifier.
+    """
+    quoted = {}
+
+    def placeholder(match):
+        name = f"__column_{len(quoted)}"
+        quoted[name] = match.group(1)
+        return name
+
+    source = _QUOTED_COLUMN.sub(placeholder, expression)
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"invalid syntax: {e.msg}") from None
+    return tree.body, quoted
+
+
+def filter_columns(expression: str, columns) -> List[str]:
+    """Returns the columns an expression refers to, in `columns` order.
+
+    Expressions that can't be parsed refer to no columns.
+    """
+    try:
+        tree, quoted = _parse(expression)
+    except ValueError:
+        return []
+    names = {
+        quoted.get(node.id, node.id)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name)
+    }
+    return [col for col in columns if col in names]
+
+
+def filter_runs(df: pd.DataFrame, expression: str) -> pd.DataFrame:
+    """Returns the rows of a runs table that match a filter expression.
+
+    Args:
+        df (pd.DataFrame): The runs, e.g. as returned by `load_results()`.
+        expression (str): The filter, e.g. `accuracy > 0.9 and not converged`.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+
+    Raises:
+        ValueError: If the expression is invalid or uses anything but
+            columns, constants, comparisons and `and`, `or` and `not`.
+    """
+    tree, quoted = _parse(expression)
+
+    def evaluate(node):
+        if isinstance(node, ast.Name):
+            name = quoted.get(node.id, node.id)
+            if name not in df.columns:
+                raise ValueError(f"unknown column '{name}'")
+            return df[name]
+        if isinstance(node, ast.Constant):
+            return node.value
+        if (
+            isinstance(node, ast.UnaryOp)
+            and isinstance(node.op, (ast.USub, ast.UAdd))
+            and isinstance(node.operand, ast.Constant)
+            and isinstance(node.operand.value, (int, float))
+        ):
+            value = node.operand.value
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [evaluate_constant(element) for element in node.elts]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ~as_mask(evaluate(node.operand))
+        if isinstance(node, ast.BoolOp):
+            masks = [as_mask(evaluate(value)) for value in node.values]
+            combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+            mask = masks[0]
+            for other in masks[1:]:
+                mask = combine(mask, other)
+            return mask
+        if isinstance(node, ast.Compare):
+            mask = None
+            left = evaluate(node.left)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = evaluate(comparator)
+                result = compare(op, left, right)
+                mask = result if mask is None else mask & result
+                left = right
+            return mask
+        raise ValueError(f"'{ast.unparse(node)}' is not allowed in a filter")
+
+    def evaluate_constant(node):
+        value = evaluate(node)
+        if isinstance(value, (pd.Series, list)):
+            raise ValueError("lists can only hold constants")
+        return value
+
+    def compare(op, left, right):
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if not isinstance(left, pd.Series) or not isinstance(right, list):
+                raise ValueError("'in' needs a column and a list of values")
+            mask = left.isin(right)
+            return ~mask if isinstance(op, ast.NotIn) else mask
+        if type(op) not in _COMPARISONS:
+            raise ValueError(f"'{type(op).__name__}' comparisons are not allowed")
+        if isinstance(left, list) or isinstance(right, list):
+            raise ValueError("lists can only be used with 'in'")
+        if not isinstance(left, pd.Series) and not isinstance(right, pd.Series):
+            raise ValueError("comparisons need a column")
+        try:
+            return as_mask(_COMPARISONS[type(op)](left, right))
+        except TypeError as e:
+            raise ValueError(f"can't compare these values: {e}") from None
+
+    def as_mask(value):
+        if not isinstance(value, pd.Series):
+            raise ValueError("the filter must compare columns")
+        if value.dtype == object:
+            value = value.map(lambda item: item is True)
+        elif not pd.api.types.is_bool_dtype(value):
+            raise ValueError(f"column '{value.name}' is not a boolean")
+        return value.fillna(False).astype(bool)
+
+    return df[as_mask(evaluate(tree))]
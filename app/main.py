@@ -8,9 +8,27 @@ import streamlit as st
 
 from app.components import render_sidebar
 
+
+def home():
+    """Landing page shown when the app is opened."""
+    st.title("Welcome to Runelog!")
+    st.info("Select a view from the sidebar to get started.")
+
+
+# The page config and sidebar are rendered once here for every page; the
+# selected page only renders its own content. The built-in navigation menu is
+# hidden in favour of the links in `render_sidebar`.
 st.set_page_config(page_title="Runelog", page_icon="📜", layout="wide")
 
+page = st.navigation(
+    [
+        st.Page(home, title="Runelog", icon="📜", default=True),
+        st.Page("views/explorer.py", title="Explorer | Runelog", icon="🔬"),
+        st.Page("views/registry.py", title="Registry | Runelog", icon="📚"),
+    ],
+    position="hidden",
+)
+
 render_sidebar()
 
-st.title("Welcome to Runelog!")
-st.info("Select a view from the sidebar to get started.")
+page.run()
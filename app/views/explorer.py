@@ -9,19 +9,26 @@ run to inspect its detailed parameters, metrics, and artifacts.
 import os
 
 import re
-import pandas as pd
+import math
 import streamlit as st
 import plotly.express as px
 
-from runelog import get_tracker
-from app.components import render_sidebar
-
-st.set_page_config(page_title="🔬 Explorer | Runelog", layout="wide")
-
-render_sidebar()
+from app.components import (
+    experiment_options,
+    get_cached_tracker,
+    get_run_details,
+    list_registered_models,
+    get_model_versions,
+    load_results,
+    render_metrics_and_params,
+)
+from app.filters import filter_columns, filter_runs
 
 st.title("🔬 Experiment Explorer")
-tracker = get_tracker()
+tracker = get_cached_tracker()
+
+# Number of runs rendered per page of the runs table
+RUNS_PER_PAGE = 50
 
 
 def show_actions(run_id: str, details):
@@ -50,6 +57,8 @@ def show_actions(run_id: str, details):
                         version = tracker.register_model(
                             run_id, model_artifact, model_name
                         )
+                        list_registered_models.clear()
+                        get_model_versions.clear()
                         st.success(
                             f"Successfully registered model '{model_name}' as version {version}!"
                         )
@@ -62,8 +71,11 @@ def show_actions(run_id: str, details):
         st.info("No model artifact found in this run to register.")
 
 
+@st.fragment
 def show_run_details(run_id: str):
-    details = tracker.get_run_details(run_id)
+    # Runs as a fragment, so registering the model or opening artifacts
+    # doesn't rerun the experiment and runs table above it
+    details = get_run_details(tracker, run_id)
 
     c1, c2 = st.columns(2)
     with c1:
@@ -75,26 +87,7 @@ def show_run_details(run_id: str):
         st.error("Could not load details for this run.")
         return
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("#### Metrics")
-        metrics = details.get("metrics", {})
-        if metrics:
-            for key, value in metrics.items():
-                st.metric(label=key, value=round(value, 4))
-        else:
-            st.info("No metrics logged.")
-
-    with col2:
-        st.markdown("#### Parameters")
-        params = details.get("params", {})
-        if params:
-            params_df = pd.DataFrame(params.items(), columns=["Parameter", "Value"])
-            params_df["Value"] = params_df["Value"].astype(str)
-            st.table(params_df)
-        else:
-            st.info("No parameters logged.")
+    render_metrics_and_params(details)
 
     st.markdown("#### Artifacts")
     artifacts = details.get("artifacts", [])
@@ -124,8 +117,40 @@ def show_run_details(run_id: str):
         st.info("No artifacts logged.")
 
 
-experiments = tracker.list_experiments()
-if not experiments:
+@st.fragment
+def show_run_comparison(selected_rows):
+    # Runs as a fragment, so switching the compared metric only redraws the chart
+    st.markdown("### Compare Selected Runs")
+
+    metric_columns = [
+        col for col in selected_rows.columns if not col.startswith("param_")
+    ]
+
+    if not metric_columns:
+        st.warning("No metrics found to compare for the selected runs.")
+        return
+
+    selected_metric = st.selectbox(
+        "Select a metric to compare:", options=metric_columns
+    )
+    chart_data = (
+        selected_rows[[selected_metric]]
+        .reset_index()
+        .rename(columns={"index": "run_id"})
+    )
+
+    fig = px.bar(
+        chart_data,
+        x="run_id",
+        y=selected_metric,
+        title=f"Comparison of '{selected_metric}'",
+    )
+    fig.update_xaxes(tickangle=45)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+experiment_ids, experiment_names = experiment_options(tracker)
+if not experiment_ids:
     st.info("No experiments found. Run a training script to create one.")
     st.markdown("### 🚀 Getting started")
     st.code(
@@ -151,55 +176,77 @@ with tracker.start_run(experiment_name="my-first-experiment"):
     )
     st.stop()
 
-experiment_map = {exp["experiment_id"]: exp["name"] for exp in experiments}
-
 selected_experiment_id = st.selectbox(
     "Select an Experiment",
-    options=list(experiment_map.keys()),
-    format_func=lambda exp_id: f"{experiment_map[exp_id]} (id: {exp_id})",
+    options=experiment_ids,
+    format_func=lambda exp_id: f"{experiment_names[exp_id]} (id: {exp_id})",
 )
 
 if selected_experiment_id:
-    results_df = tracker.load_results(selected_experiment_id)
+    # Columns of the experiment's last full load, offered in the column picker
+    known_columns = st.session_state.setdefault("explorer_known_columns", {})
+    all_columns = known_columns.get(selected_experiment_id)
+    columns_key = f"explorer_columns_{selected_experiment_id}"
+    selected_columns = st.session_state.get(columns_key)
+
+    # Once some columns are deselected, only the selected ones and those the
+    # filter refers to are read
+    load_columns = None
+    if all_columns is not None and selected_columns:
+        if set(selected_columns) != set(all_columns):
+            query_columns = filter_columns(
+                st.session_state.get("explorer_filter", ""), all_columns
+            )
+            load_columns = tuple(dict.fromkeys(list(selected_columns) + query_columns))
+
+    results_df = load_results(tracker, selected_experiment_id, load_columns)
+    if load_columns is None:
+        all_columns = known_columns[selected_experiment_id] = (
+            results_df.columns.tolist()
+        )
 
     st.markdown("### Runs")
     if not results_df.empty:
+        filter_query = st.text_input(
+            "Filter runs",
+            placeholder="e.g. accuracy > 0.9 and param_alpha == 0.5",
+            key="explorer_filter",
+        )
+        if filter_query:
+            try:
+                results_df = filter_runs(results_df, filter_query)
+            except Exception as e:
+                st.error(f"Invalid filter expression: {e}")
+
+        # Only send the current page of runs to the browser
+        num_pages = max(1, math.ceil(len(results_df) / RUNS_PER_PAGE))
+        page = 1
+        if num_pages > 1:
+            page = st.number_input(
+                "Page", min_value=1, max_value=num_pages, value=1, step=1
+            )
+        page_df = results_df.iloc[(page - 1) * RUNS_PER_PAGE : page * RUNS_PER_PAGE]
+
         selected_run_ids = st.multiselect(
             "Select two or more runs to compare:",
-            options=results_df.index.tolist(),
+            options=page_df.index.tolist(),
         )
 
-        st.dataframe(results_df, use_container_width=True)
+        selected_columns = st.multiselect(
+            "Columns", options=all_columns, default=all_columns, key=columns_key
+        )
 
-        if len(selected_run_ids) >= 2:
-            st.markdown("### Compare Selected Runs")
-
-            selected_rows = results_df.loc[selected_run_ids]
-            metric_columns = [
-                col for col in selected_rows.columns if not col.startswith("param_")
-            ]
-
-            if not metric_columns:
-                st.warning("No metrics found to compare for the selected runs.")
-            else:
-                selected_metric = st.selectbox(
-                    "Select a metric to compare:", options=metric_columns
-                )
-                chart_data = (
-                    selected_rows[[selected_metric]]
-                    .reset_index()
-                    .rename(columns={"index": "run_id"})
-                )
-
-                fig = px.bar(
-                    chart_data,
-                    x="run_id",
-                    y=selected_metric,
-                    title=f"Comparison of '{selected_metric}'",
-                )
-                fig.update_xaxes(tickangle=45)
-                st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(
+            page_df[[col for col in selected_columns if col in page_df.columns]],
+            use_container_width=True,
+        )
+        st.caption(
+            f"Showing {len(page_df)} of {len(results_df)} runs "
+            f"(page {page} of {num_pages})."
+        )
 
+        if len(selected_run_ids) >= 2:
+            show_run_comparison(results_df.loc[selected_run_ids])
         elif len(selected_run_ids) == 1:
             show_run_details(selected_run_ids[0])
     else:
@@ -8,19 +8,16 @@ parameters.
 
 import streamlit as st
 
-from runelog import get_tracker
-from app.components import display_version_details, render_sidebar
-
-st.set_page_config(
-    page_title="📚 Registry | Runelog",
-    layout="wide"
+from app.components import (
+    display_version_details,
+    get_cached_tracker,
+    get_model_versions,
+    list_registered_models,
 )
 
-render_sidebar()
-
-tracker = get_tracker()
+tracker = get_cached_tracker()
 
-registered_models = tracker.list_registered_models()
+registered_models = list_registered_models(tracker)
 
 if not registered_models:
     st.info("No models have been registered yet.")
@@ -39,7 +36,7 @@ with col1:
 with col2:
     if selected_model_name:
         st.markdown(f"#### Versions for `{selected_model_name}`")
-        versions = tracker.get_model_versions(selected_model_name)
+        versions = get_model_versions(tracker, selected_model_name)
 
         if not versions:
             st.warning("No versions found for this model.")
@@ -1,5 +1,7 @@
 __version__ = "0.2.0"
 
+import os
+
 from .runelog import RuneLog
 from .exceptions import (
     RunelogException,
@@ -20,8 +22,11 @@ from .exceptions import (
     NoVersionsFound,
 )
 
+# Tracker instances keyed by their absolute root path
+_INSTANCES = {}
+
 
-def get_tracker(path: str = ".") -> RuneLog:
+def get_tracker(path: str = ".", fresh: bool = False) -> RuneLog:
     """
     Initializes and returns the main tracker instance.
 
@@ -29,9 +34,14 @@ def get_tracker(path: str = ".") -> RuneLog:
     The returned object is used to create experiments, start runs, and log
     all relevant machine learning data.
 
+    Trackers are cached per root directory, so repeated calls with the same
+    path return the same instance instead of constructing a new one.
+
     Args:
         path (str, optional): The root directory for storing experiments.
             Defaults to the current directory.
+        fresh (bool, optional): If True, always construct a new tracker and
+            replace the cached instance for this path. Defaults to False.
 
     Returns:
         RuneLog: An instance of the main tracker class, ready to be used.
@@ -46,7 +56,10 @@ def get_tracker(path: str = ".") -> RuneLog:
 
 
     """
-    return RuneLog(path=path)
+    root_path = os.path.abspath(path)
+    if fresh or root_path not in _INSTANCES:
+        _INSTANCES[root_path] = RuneLog(path=root_path)
+    return _INSTANCES[root_path]
 
 
 __all__ = ["get_tracker", "RuneLog", "exceptions", "__version__"]
@@ -5,7 +5,6 @@ from rich.panel import Panel
 
 import runelog
 from runelog import get_tracker, exceptions
-from runelog.runner import run_sweep
 
 import os
 import sys
@@ -64,7 +63,8 @@ def main_callback(
     ),
 ):
     """
-    Initialize the tracker and handle top-level commands.
+    Handle top-level options. The tracker is only initialized by the
+    commands that need it.
     """
     if version:
         console.print("Runelog CLI v0.1.0")  # TODO: runelog.__version__
@@ -75,9 +75,6 @@ def main_callback(
         typer.echo(ctx.get_help())  # Display Typer help
         raise typer.Exit()
 
-    if ctx.obj is None:
-        ctx.obj = get_tracker()
-
 
 ## Experiments
 
@@ -96,7 +93,7 @@ def list_experiments(
     ),
 ):
     """List all available experiments."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     summaries = tracker.get_experiment_summaries(
         sort_by=sort_by, ascending=not descending
     )
@@ -140,7 +137,7 @@ def get_experiment_details(
     ),
 ):
     """Get details for a specific experiment."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         experiment_id, _ = tracker._resolve_experiment_id(experiment_name_or_id)
@@ -203,7 +200,7 @@ def delete_experiment(
     ),
 ):
     """Delete an experiment and all of its associated runs."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     console.print(
         f"You are about to delete experiment '{experiment_id}'.",
@@ -237,7 +234,7 @@ def export_experiment(
     ),
 ):
     """Export all runs from an experiment to a CSV file."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         experiment_id, _ = tracker._resolve_experiment_id(experiment_name_or_id)
@@ -276,7 +273,7 @@ def delete_experiment(
     ),
 ):
     """Delete an experiment and all of its associated runs."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         if typer.confirm(
@@ -316,7 +313,7 @@ def list_runs(
     ),
 ):
     """List all runs and their metrics for a given experiment."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     try:
         results_df = tracker.load_results(
             experiment_name_or_id, sort_by=sort_by, ascending=not descending
@@ -363,7 +360,7 @@ def get_run_details(
     run_id: str = typer.Argument(..., help="The ID of the run to inspect."),
 ):
     """Display the detailed parameters, metrics, and artifacts for a specific run."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     details = tracker.get_run_details(run_id)
 
     if not details:
@@ -395,7 +392,7 @@ def delete_run(
     run_id: str = typer.Argument(..., help="The ID of the run to delete."),
 ):
     """Delete a run and all of its associated artifacts."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     if typer.confirm(
         f"Are you sure you want to delete run '{run_id}'? This action cannot be undone."
     ):
@@ -424,7 +421,7 @@ def download_artifact(
     ),
 ):
     """Download an artifact from a specific run."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     try:
         final_path = tracker.download_artifact(
             run_id, artifact_name, destination_path=output_path or "."
@@ -445,7 +442,7 @@ def compare_runs(
     run_ids: List[str] = typer.Argument(..., help="Two or more run IDs to compare."),
 ):
     """Compare the parameters and metrics of multiple runs side-by-side."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     if len(run_ids) < 2:
         console.print(
@@ -532,7 +529,7 @@ def register_model(
     model_name: str = typer.Argument(..., help="The name to register the model under."),
 ):
     """Register a model from a run's artifact to the model registry."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
     try:
         console.print(
             f"Registering artifact '[bold cyan]{artifact_name}[/bold cyan]' from run '[bold yellow]{run_id}[/bold yellow]'..."
@@ -560,7 +557,7 @@ def list_registered_models(
     ),
 ):
     """List all models in the registry."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         model_names = tracker.list_registered_models()
@@ -571,9 +568,9 @@ def list_registered_models(
 
         all_models_data = []
         for name in model_names:
-            versions = tracker.get_model_versions(name)
-            if versions:
-                all_models_data.append(versions[0])
+            latest_version = tracker.get_latest_model_version(name)
+            if latest_version:
+                all_models_data.append(latest_version)
 
         sort_key_map = {
             "name": "model_name",
@@ -601,18 +598,21 @@ def list_registered_models(
             expand=True,
         )
 
-        for data in all_models_data:
-            timestamp = _fmt_timestamp(data.get("registration_timestamp"))
-            tags = data.get("tags", {})
-            tag_str = (
-                ", ".join([f"{k}={v}" for k, v in tags.items()]) if tags else "none"
-            )
-            table.add_row(
+        timestamps = _fmt_timestamps(
+            [data.get("registration_timestamp") for data in all_models_data]
+        )
+        rows = [
+            (
                 data.get("model_name", "N/A"),
                 data.get("version", "N/A"),
                 timestamp,
-                tag_str,
+                _fmt_tags(data.get("tags")),
             )
+            for data, timestamp in zip(all_models_data, timestamps)
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
         console.print(table)
 
@@ -642,7 +642,7 @@ def list_registered_model_versions(
     ),
 ):
     """List all versions of a model in the registry."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         versions = tracker.get_model_versions(
@@ -665,24 +665,22 @@ def list_registered_model_versions(
             expand=True,
         )
 
-        for version_info in versions:
-            # Format the timestamp for readability
-            timestamp = datetime.fromisoformat(
-                version_info.get("registration_timestamp", "")
-            ).strftime("%Y-%m-%d %H:%M")
-
-            # Format the tags dictionary
-            tags = version_info.get("tags", {})
-            tag_str = (
-                ", ".join([f"{k}={v}" for k, v in tags.items()]) if tags else "none"
-            )
-
-            table.add_row(
+        # Format the timestamps for readability
+        timestamps = _fmt_timestamps(
+            [v.get("registration_timestamp") for v in versions]
+        )
+        rows = [
+            (
                 version_info.get("version", "N/A"),
                 timestamp,
                 version_info.get("source_run_id", "N/A"),
-                tag_str,
+                _fmt_tags(version_info.get("tags")),
             )
+            for version_info, timestamp in zip(versions, timestamps)
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
         console.print(table)
 
@@ -707,7 +705,7 @@ def manage_tags(
     ),
 ):
     """Add or remove tags for a specific model version in the registry."""
-    tracker = ctx.obj
+    tracker = _get_tracker(ctx)
 
     try:
         # Get the existing tags
@@ -855,6 +853,9 @@ def sweep(
     )
 ):
     """Run a series of experiments from a configuration file."""
+    # Deferred import: the runner pulls in scikit-learn
+    from runelog.runner import run_sweep
+
     try:
         console.print(
             f"🚀 Loading configuration from: [bold green]{config_path}[/bold green]"
@@ -871,6 +872,13 @@ def sweep(
 # Utils
 
 
+def _get_tracker(ctx: typer.Context):
+    """Returns the tracker stored in the context, creating it on first use."""
+    if ctx.obj is None:
+        ctx.obj = get_tracker()
+    return ctx.obj
+
+
 def _fmt_timestamp(ts):
     """Helper function to format timestamps."""
     if isinstance(ts, str):
@@ -879,5 +887,43 @@ def _fmt_timestamp(ts):
         except ValueError:
             return ts
     if isinstance(ts, datetime):
-        return ts.strftime("%Y-%m-%d %H:%M")
+        # Shown in local time. Naive timestamps are assumed to be local already
+        return ts.astimezone().strftime("%Y-%m-%d %H:%M")
     return None
+
+
+def _fmt_tags(tags: Optional[dict]) -> str:
+    """Formats a tags dictionary as `key=value` pairs for a table cell."""
+    if not tags:
+        return "none"
+    return ", ".join(f"{key}={value}" for key, value in tags.items())
+
+
+def _fmt_timestamps(timestamps: List[Optional[str]]) -> List[Optional[str]]:
+    """Formats a list of ISO timestamps in one vectorized pass.
+
+    Like `_fmt_timestamp`, timezone-aware values are shown in local time and
+    naive ones are assumed to be local already. Values that can't be parsed
+    in one pass, e.g. naive ones mixed with aware ones, are formatted with
+    `_fmt_timestamp`.
+    """
+    import pandas as pd
+    from dateutil.tz import tzlocal
+
+    try:
+        # An explicit format keeps pandas from warning about values it can't
+        # infer one for, which would be printed with the table
+        parsed = pd.to_datetime(
+            pd.Series(timestamps, dtype=object), errors="coerce", format="ISO8601"
+        )
+    except (ValueError, TypeError):
+        # e.g. naive and aware timestamps, or different UTC offsets
+        return [_fmt_timestamp(ts) for ts in timestamps]
+
+    if parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_convert(tzlocal())
+    formatted = parsed.dt.strftime("%Y-%m-%d %H:%M")
+    return [
+        value if isinstance(value, str) else _fmt_timestamp(ts)
+        for value, ts in zip(formatted, timestamps)
+    ]
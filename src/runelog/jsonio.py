@@ -0,0 +1,88 @@
+"""
+JSON helpers for reading and writing Runelog metadata files.
+
+`orjson` is used when it is installed, falling back to the standard library
+`json` module otherwise. Functions operate on bytes so that files can be read
+and written in a single call with `open(path, "rb")` and `open(path, "wb")`.
+"""
+
+import os
+import json
+import secrets
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    _COMPACT_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _DUMPS_OPTIONS = _COMPACT_OPTIONS | orjson.OPT_INDENT_2
+
+
+def loads(data: bytes):
+    """Deserializes a JSON document from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the json module may contain NaN or Infinity,
+            # which orjson rejects
+            pass
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = True) -> bytes:
+    """Serializes an object to a JSON document.
+
+    With `orjson`, numpy scalars and arrays are serialized natively, and NaN
+    and infinite floats are written as `null`.
+
+    Args:
+        obj: The object to serialize.
+        indent (bool, optional): Whether to indent the document for people
+            to read, or write it on one line. Defaults to True.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS if indent else _COMPACT_OPTIONS)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_line(obj) -> bytes:
+    """Serializes an object to a single line of JSON, including the newline.
+
+    Used for append-only JSON Lines files such as a run's `metrics.jsonl`.
+    Accepts the same objects as `dumps()`.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_COMPACT_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def write(path: str, obj, indent: bool = True) -> None:
+    """Writes an object to a JSON file in a single write call.
+
+    The document is written to a uniquely named temporary file that then
+    replaces `path`, so readers never see a partially written file and
+    concurrent writers never share a temporary file. See `dumps()` for
+    `indent`.
+    """
+    data = dumps(obj, indent)
+    tmp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,22 +1,34 @@
 import os
 import sys
-import json
-import uuid
-import yaml
-import joblib
+import copy
+import mmap
+import time
+import struct
+import numbers
+import secrets
 import shutil
 import hashlib
 import platform
 import subprocess
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Generator, Tuple
 
-from typing import Any, Dict, List, Optional, Generator
+if TYPE_CHECKING:
+    # pandas, joblib, yaml and concurrent.futures are slow to import, so they
+    # are only imported by the methods that use them
+    from concurrent.futures import ThreadPoolExecutor
 
-from . import exceptions
+    import pandas as pd
+
+from . import exceptions, jsonio
+
+# Records of a run's `metrics.bin` file: the metric's name ID, the step, the
+# Unix timestamp and the value
+_METRIC_RECORD = struct.Struct("<Iqdd")
 
 
 class RuneLog:
@@ -28,6 +40,18 @@ class RuneLog:
     provides a model registry for versioning and managing models.
     """
 
+    # Maximum number of runs kept in the `get_run`/`get_run_details` cache
+    _RUN_CACHE_SIZE = 4096
+
+    # Removes deleted experiments and runs in the background, shared by all
+    # trackers and created on first use. Its thread is joined at interpreter
+    # exit, so pending removals still finish
+    _delete_executor: Optional["ThreadPoolExecutor"] = None
+
+    # Buffer size of the active run's param and metric logs, in bytes. The
+    # logs are written when the buffer fills up and when the run ends
+    _LOG_BUFFER_SIZE = 64 * 1024
+
     def __init__(self, path="."):
         """Initializes the tracker and creates required directories.
 
@@ -40,6 +64,51 @@ class RuneLog:
         self._registry_dir = os.path.join(self.root_path, ".registry")
         self._active_run_id = None
         self._active_experiment_id = None
+        # Directory of the active run, joined once when the run starts
+        self._active_run_path = None
+
+        # The active run's open `params.jsonl`, `metrics.jsonl` and
+        # `metric_names.jsonl` files, keyed by kind
+        self._run_logs = {}
+
+        # The active run's open `metrics.bin` file, the IDs its metric names
+        # are stored under, and the step each metric is next logged at
+        self._metric_records = None
+        self._metric_ids = {}
+        self._metric_steps = {}
+
+        # Metadata of the active run, mirrored in its `meta.json` file
+        self._run_meta = None
+
+        # Parsed model versions keyed by model name, with the inode and mtime
+        # of each version's `meta.json` at the time they were read
+        self._versions_cache = {}
+
+        # Results of `get_run` and `get_run_details` keyed by kind and run ID,
+        # with the mtimes of the run and artifacts directories they were read at
+        self._run_cache = OrderedDict()
+
+        # Output of `pip freeze`, captured by the first run that logs its
+        # environment
+        self._pip_freeze_output = None
+
+        # Whether the default experiment is known to exist, so runs logged to
+        # it don't check for its `meta.json` every time
+        self._default_experiment_exists = False
+
+        # Experiment metadata keyed by ID and the experiment ID of each run,
+        # mirrored in `.mlruns/index.json` so listing experiments doesn't
+        # open every `meta.json` and locating a run doesn't search them all
+        self._index_path = os.path.join(self._mlruns_dir, "index.json")
+        self._index = None
+        self._run_index = None
+        self._index_names = None  # Experiment name to ID, derived from the index
+        # The inode and mtime of each experiment's `meta.json` when it was
+        # indexed, so that replaced or edited experiments are read again
+        self._index_stamps = {}
+        # One past the highest experiment ID seen, so that IDs of deleted
+        # experiments aren't given to new ones
+        self._next_experiment_id = 0
 
         os.makedirs(self._mlruns_dir, exist_ok=True)
         os.makedirs(self._registry_dir, exist_ok=True)
@@ -53,40 +122,78 @@ class RuneLog:
         Raises:
             exceptions.NoActiveRun: If called outside of an active run context.
         """
-        if not self._active_run_id:
+        if self._active_run_path is None:
             raise exceptions.NoActiveRun()
-        return os.path.join(
-            self._mlruns_dir, self._active_experiment_id, self._active_run_id
-        )
+        return self._active_run_path
 
     def _get_run_path_by_id(self, run_id: str) -> Optional[str]:
-        """Finds the full path to a run directory from its ID."""
-        for exp_id in os.listdir(self._mlruns_dir):
-            exp_path = os.path.join(self._mlruns_dir, exp_id)
-            if not os.path.isdir(exp_path):
-                continue
+        """Finds the full path to a run directory from its ID.
+
+        The run's experiment is looked up in the runs index first. Runs that
+        aren't indexed, e.g. those logged by earlier versions, are searched
+        for in every experiment and then added to the index.
+        """
+        if self._run_index is None:
+            self._load_index_file()
 
-            run_path = os.path.join(exp_path, run_id)
-            if os.path.isdir(run_path):
+        experiment_id = self._run_index.get(run_id)
+        if experiment_id is not None:
+            run_path = self._get_run_in_experiment(experiment_id, run_id)
+            if run_path:
+                return run_path
+
+        with os.scandir(self._mlruns_dir) as entries:
+            experiment_ids = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+        for experiment_id in experiment_ids:
+            run_path = self._get_run_in_experiment(experiment_id, run_id)
+            if run_path:
                 return run_path
         return None
 
+    def _get_run_in_experiment(self, experiment_id: str, run_id: str) -> Optional[str]:
+        """Finds the path to a run directory in a known experiment.
+
+        The run is added to the runs index if it isn't indexed yet.
+
+        Returns:
+            Optional[str]: The absolute path to the run's directory, or None
+                if the experiment has no such run.
+        """
+        run_path = os.path.join(self._mlruns_dir, experiment_id, run_id)
+        if not os.path.isdir(run_path):
+            return None
+        if self._run_index is None or self._run_index.get(run_id) != experiment_id:
+            self._add_runs_to_index([run_id], experiment_id)
+        return run_path
+
     def _log_git_metadata(self):
         """
         Logs Git metadata to a dedicated source_control.json file in the
         active run's directory if the root directory is Git repo
         """
         try:
-            commit_hash = (
-                subprocess.check_output(["git", "rev-parse", "HEAD"]).strip().decode()
-            )
-            branch_name = (
-                subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-                .strip()
+            # One call prints the commit hash, then the branch name
+            commit_hash, branch_name = (
+                subprocess.check_output(
+                    ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"]
+                )
                 .decode()
+                .split()
             )
-            is_dirty = bool(
-                subprocess.check_output(["git", "status", "--porcelain"]).strip()
+            # Exits with 1 if tracked files differ from HEAD, without
+            # producing output for every changed file like `git status`
+            is_dirty = (
+                subprocess.run(
+                    ["git", "diff", "--quiet", "HEAD"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                ).returncode
+                != 0
             )
 
             git_meta = {
@@ -96,9 +203,8 @@ class RuneLog:
             }
 
             meta_path = os.path.join(self._get_run_path(), "source_control.json")
-            with open(meta_path, "w") as f:
-                json.dump(git_meta, f, indent=4)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            jsonio.write(meta_path, git_meta)
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
             # Fail silently if not in a git repo or git is not installed
             pass
 
@@ -108,11 +214,15 @@ class RuneLog:
         pip-installable requirements.txt artifact.
         """
         try:
-            reqs_raw = (
-                subprocess.check_output([sys.executable, "-m", "pip", "freeze"])
-                .decode()
-                .strip()
-            )
+            # Installed packages rarely change while a process runs, and
+            # `pip freeze` takes hundreds of milliseconds, so it only runs once
+            if self._pip_freeze_output is None:
+                self._pip_freeze_output = (
+                    subprocess.check_output([sys.executable, "-m", "pip", "freeze"])
+                    .decode()
+                    .strip()
+                )
+            reqs_raw = self._pip_freeze_output
 
             # Installable requirements.txt artifact
             artifact_path = os.path.join(
@@ -136,8 +246,7 @@ class RuneLog:
                 "packages": packages,
             }
             meta_path = os.path.join(self._get_run_path(), "environment.json")
-            with open(meta_path, "w") as f:
-                json.dump(env_meta, f, indent=4)
+            jsonio.write(meta_path, env_meta)
 
         except (subprocess.CalledProcessError, FileNotFoundError):
             # Fails silently
@@ -162,6 +271,79 @@ class RuneLog:
         if os.path.exists(script_path):
             self.log_artifact(script_path)
 
+    def _link_or_copy(self, src_path: str, dst_path: str) -> None:
+        """Places the contents of `src_path` at `dst_path`.
+
+        A hard link is created when both paths are on the same filesystem, so
+        no data is copied. The file is copied otherwise, e.g. across devices
+        or on filesystems without hard links.
+        """
+        try:
+            os.link(src_path, dst_path)
+        except OSError:
+            self._copy_file(src_path, dst_path)
+
+    @staticmethod
+    def _copy_file(src_path: str, dst_path: str) -> None:
+        """Copies the contents of `src_path` to `dst_path`, without metadata.
+
+        On Linux, `os.copy_file_range` copies the data within the kernel and
+        clones it instead on copy-on-write filesystems such as Btrfs and XFS.
+        `shutil.copyfile` is used elsewhere, or if the filesystems involved
+        don't support it.
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if not copied:
+                            break
+                        remaining -= copied
+                return
+            except OSError:
+                pass  # Missing files are raised again by copyfile
+        shutil.copyfile(src_path, dst_path)
+
+    def _remove_dir(self, path: str) -> None:
+        """Removes a directory under `.mlruns` without waiting for its files.
+
+        The directory is renamed into `.mlruns/.trash`, which experiment and
+        run listings skip, so it disappears immediately. Its files are then
+        deleted by a background thread. Directories left in the trash by an
+        interrupted process are removed along with it.
+        """
+        trash_dir = os.path.join(self._mlruns_dir, ".trash")
+        os.makedirs(trash_dir, exist_ok=True)
+        trash_path = os.path.join(
+            trash_dir, f"{os.path.basename(path)}.{secrets.token_hex(4)}"
+        )
+        try:
+            os.rename(path, trash_path)
+        except OSError:
+            shutil.rmtree(path)
+            return
+
+        if RuneLog._delete_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            RuneLog._delete_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="runelog-delete"
+            )
+        RuneLog._delete_executor.submit(self._empty_trash, trash_dir)
+
+    @staticmethod
+    def _empty_trash(trash_dir: str) -> None:
+        """Removes every directory in `.mlruns/.trash`, keeping the trash itself."""
+        try:
+            with os.scandir(trash_dir) as entries:
+                trash_paths = [entry.path for entry in entries]
+        except FileNotFoundError:
+            return
+        for trash_path in trash_paths:
+            shutil.rmtree(trash_path, ignore_errors=True)
+
     def _hash_file(self, file_path: str) -> str:
         """Calculates the SHA256 hash of a file."""
         sha256_hash = hashlib.sha256()
@@ -173,6 +355,160 @@ class RuneLog:
 
     # Experiments and runs
 
+    def _read_index(self) -> Dict[str, Optional[Dict]]:
+        """Returns the experiments index, rebuilding it if it is out of date.
+
+        The index maps experiment IDs to their metadata. It is kept in memory
+        and validated against the experiment directories on each call, which
+        costs a directory listing and a `stat` of each `meta.json` instead of
+        reading them all. The index is rebuilt from the `meta.json` files
+        when it is missing or unreadable. Otherwise, only the `meta.json`
+        files of experiments it doesn't know yet, or whose file was replaced
+        or modified since it was indexed, are read. Directories without a
+        readable `meta.json` are recorded as `None`, and read again once the
+        file changes.
+
+        Returns:
+            Dict[str, Optional[Dict]]: The metadata of each experiment, keyed
+                by ID.
+        """
+        with os.scandir(self._mlruns_dir) as entries:
+            experiment_ids = {
+                entry.name
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            }
+
+        if self._index is None:
+            self._load_index_file()
+            self._count_experiment_ids(self._index or ())
+
+        # Stamps are taken before any file is read, so a file replaced while
+        # it is read is read again next time
+        stamps = {
+            experiment_id: self._experiment_stamp(experiment_id)
+            for experiment_id in sorted(experiment_ids)
+        }
+        if self._index is None or stamps != self._index_stamps:
+            known = self._index or {}
+            self._index_names = None
+            self._index = {
+                experiment_id: (
+                    known[experiment_id]
+                    if experiment_id in known
+                    and self._index_stamps.get(experiment_id) == stamp
+                    else self.get_experiment(experiment_id)
+                )
+                for experiment_id, stamp in stamps.items()
+            }
+            self._index_stamps = stamps
+            self._count_experiment_ids(experiment_ids)
+            self._try_write_index()
+
+        return self._index
+
+    def _experiment_stamp(self, experiment_id: str) -> Optional[List[int]]:
+        """Returns the inode and mtime of an experiment's `meta.json`, if any."""
+        try:
+            stat = os.stat(
+                f"{self._mlruns_dir}{os.sep}{experiment_id}{os.sep}meta.json"
+            )
+        except OSError:
+            return None
+        return [stat.st_ino, stat.st_mtime_ns]
+
+    def _count_experiment_ids(self, experiment_ids) -> None:
+        """Moves the next experiment ID past every numeric ID given."""
+        for experiment_id in experiment_ids:
+            if experiment_id.isdigit():
+                self._next_experiment_id = max(
+                    self._next_experiment_id, int(experiment_id) + 1
+                )
+
+    def _load_index_file(self) -> None:
+        """Loads `.mlruns/index.json` into the in-memory indexes.
+
+        The experiments index is left as None if the file is missing or
+        unreadable, so that `_read_index` rebuilds it. The runs index starts
+        empty in that case and is filled in as runs are located.
+        """
+        try:
+            with open(self._index_path, "rb") as f:
+                data = jsonio.loads(f.read())
+            experiments = data.get("experiments")
+            runs = data.get("runs")
+            next_id = data.get("next_experiment_id")
+            stamps = data.get("stamps")
+        except (FileNotFoundError, jsonio.JSONDecodeError, AttributeError):
+            experiments = runs = next_id = stamps = None
+
+        self._index = experiments if isinstance(experiments, dict) else None
+        self._run_index = runs if isinstance(runs, dict) else {}
+        self._index_stamps = stamps if isinstance(stamps, dict) else {}
+        self._index_names = None
+        if isinstance(next_id, int):
+            self._next_experiment_id = max(self._next_experiment_id, next_id)
+
+    def _add_run_to_index(self, run_id: str, experiment_id: str) -> None:
+        """Records the experiment of a run in the runs index."""
+        self._add_runs_to_index([run_id], experiment_id)
+
+    def _add_runs_to_index(self, run_ids: List[str], experiment_id: str) -> None:
+        """Records the experiment of several runs, writing the index once.
+
+        The index file is only written if any of the runs was missing.
+        """
+        self._read_index()
+        missing = [
+            run_id for run_id in run_ids if self._run_index.get(run_id) != experiment_id
+        ]
+        if missing:
+            self._run_index.update(dict.fromkeys(missing, experiment_id))
+            self._try_write_index()
+
+    def _find_experiment_id(self, name: str) -> Optional[str]:
+        """Looks up an experiment's ID by name in the experiments index.
+
+        Returns:
+            Optional[str]: The ID of the first experiment with this name, or
+                None if there is none.
+        """
+        index = self._read_index()
+        if self._index_names is None:
+            self._index_names = {}
+            for experiment_id, meta in index.items():
+                if meta and "name" in meta:
+                    self._index_names.setdefault(meta["name"], experiment_id)
+        return self._index_names.get(name)
+
+    def _write_index(self) -> None:
+        """Writes the in-memory indexes to `.mlruns/index.json`.
+
+        The index grows with every run and is rewritten when runs start, so
+        it is written without indentation.
+        """
+        jsonio.write(
+            self._index_path,
+            {
+                "experiments": self._index,
+                "runs": self._run_index,
+                "stamps": self._index_stamps,
+                "next_experiment_id": self._next_experiment_id,
+            },
+            indent=False,
+        )
+
+    def _try_write_index(self) -> None:
+        """Writes the indexes, keeping them in memory only if that fails.
+
+        The indexes can always be rebuilt from the run directories, so a
+        read-only tracking directory only makes lookups slower.
+        """
+        try:
+            self._write_index()
+        except OSError:
+            pass
+
     def get_or_create_experiment(self, name: str) -> str:
         """Gets an existing experiment by name or creates a new one.
 
@@ -185,20 +521,34 @@ class RuneLog:
         Returns:
             str: The unique ID of the new or existing experiment.
         """
-        for experiment_id in os.listdir(self._mlruns_dir):
-            meta_path = os.path.join(self._mlruns_dir, experiment_id, "meta.json")
-            if os.path.exists(meta_path):
-                with open(meta_path, "r") as f:
-                    if json.load(f).get("name") == name:
-                        return experiment_id
-
-        experiment_id = str(len(os.listdir(self._mlruns_dir)))
+        experiment_id = self._find_experiment_id(name)
+        if experiment_id is not None:
+            return experiment_id
+
+        # IDs count up past every ID seen, so the ID of a deleted experiment
+        # is never given to a new one that other trackers could mistake for it
+        self._read_index()
+        next_id = self._next_experiment_id
+        while os.path.exists(os.path.join(self._mlruns_dir, str(next_id))):
+            next_id += 1
+        self._next_experiment_id = next_id + 1
+        return self._create_experiment(str(next_id), name)
+
+    def _create_experiment(self, experiment_id: str, name: str) -> str:
+        """Creates an experiment with the given ID and adds it to the index."""
+        index = self._read_index()
         experiment_path = os.path.join(self._mlruns_dir, experiment_id)
         os.makedirs(experiment_path, exist_ok=True)
 
         meta = {"experiment_id": experiment_id, "name": name}
-        with open(os.path.join(experiment_path, "meta.json"), "w") as f:
-            json.dump(meta, f, indent=4)
+        jsonio.write(os.path.join(experiment_path, "meta.json"), meta)
+
+        index[experiment_id] = meta
+        self._index_stamps[experiment_id] = self._experiment_stamp(experiment_id)
+        if self._index_names is not None:
+            self._index_names.setdefault(name, experiment_id)
+        self._count_experiment_ids([experiment_id])
+        self._write_index()
 
         return experiment_id
 
@@ -209,14 +559,7 @@ class RuneLog:
             List[Dict]: A list of dictionaries, where each dictionary contains
                 the metadata of an experiment (e.g., name and ID).
         """
-        experiments = []
-        for experiment_id in os.listdir(self._mlruns_dir):
-            meta_path = os.path.join(self._mlruns_dir, experiment_id, "meta.json")
-            if os.path.exists(meta_path):
-                with open(meta_path, "r") as f:
-                    meta = json.load(f)
-                    experiments.append(meta)
-        return experiments
+        return [dict(meta) for meta in self._read_index().values() if meta]
 
     def delete_experiment(self, experiment_name_or_id: str) -> None:
         """Deletes an experiment and all of its associated runs and artifacts.
@@ -229,9 +572,24 @@ class RuneLog:
             exceptions.ExperimentNotFound: If no experiment with the given
                 name or ID is found.
         """
-        _, experiment_path = self._resolve_experiment_id(experiment_name_or_id)
+        experiment_id, experiment_path = self._resolve_experiment_id(
+            experiment_name_or_id
+        )
 
-        shutil.rmtree(experiment_path)
+        self._remove_dir(experiment_path)
+        if experiment_id == "0":
+            self._default_experiment_exists = False
+
+        if self._index is not None and experiment_id in self._index:
+            del self._index[experiment_id]
+            self._index_stamps.pop(experiment_id, None)
+            self._index_names = None
+            self._run_index = {
+                run_id: exp_id
+                for run_id, exp_id in self._run_index.items()
+                if exp_id != experiment_id
+            }
+            self._write_index()
 
     @contextmanager
     def start_run(
@@ -282,29 +640,36 @@ class RuneLog:
         else:
             exp_id = "0"
 
-        if exp_id == "0" and not os.path.exists(
-            os.path.join(self._mlruns_dir, "0", "meta.json")
-        ):
-            self.get_or_create_experiment("default-experiment")
+        if exp_id == "0" and not self._default_experiment_exists:
+            if not os.path.exists(os.path.join(self._mlruns_dir, "0", "meta.json")):
+                # The default experiment keeps its ID when it is recreated
+                self._create_experiment("0", "default-experiment")
+            self._default_experiment_exists = True
 
         self._active_experiment_id = exp_id
-        self._active_run_id = uuid.uuid4().hex[:8]  # Short unique ID
+        self._active_run_id = secrets.token_hex(4)  # Short unique ID
+        self._add_run_to_index(self._active_run_id, exp_id)
 
-        run_path = self._get_run_path()
-        os.makedirs(os.path.join(run_path, "params"), exist_ok=True)
-        os.makedirs(os.path.join(run_path, "metrics"), exist_ok=True)
+        self._run_logs = {}
+        self._metric_records = None
+        self._metric_ids = {}
+        self._metric_steps = {}
+
+        run_path = os.path.join(self._mlruns_dir, exp_id, self._active_run_id)
+        self._active_run_path = run_path
         os.makedirs(os.path.join(run_path, "artifacts"), exist_ok=True)
 
-        initial_meta = {
+        self._run_meta = {
             "run_id": self._active_run_id,
             "experiment_id": self._active_experiment_id,
             "status": "RUNNING",
             "start_time": datetime.now().isoformat(),
             "end_time": None,
         }
+        # Run metadata is rewritten whenever the run changes, so it isn't
+        # indented like the experiment and registry metadata
         run_meta_path = os.path.join(run_path, "meta.json")
-        with open(run_meta_path, "w") as f:
-            json.dump(initial_meta, f, indent=4)
+        jsonio.write(run_meta_path, self._run_meta, indent=False)
 
         if log_git_meta:
             self._log_git_metadata()
@@ -317,18 +682,27 @@ class RuneLog:
             yield self._active_run_id
 
         finally:
-            with open(run_meta_path, "r") as f:
-                meta = json.load(f)
-
-            meta["status"] = "FINISHED"
-            meta["end_time"] = datetime.now().isoformat()
-
-            with open(os.path.join(run_path, "meta.json"), "w") as f:
-                json.dump(meta, f, indent=4)
+            for log_file in self._run_logs.values():
+                log_file.close()
+            self._run_logs = {}
+            if self._metric_records is not None:
+                self._metric_records.close()
+                self._metric_records = None
+
+            # The metadata is only changed through this tracker while the run
+            # is active, so it is written from memory without reading it back
+            self._run_meta["status"] = "FINISHED"
+            self._run_meta["end_time"] = datetime.now().isoformat()
+            jsonio.write(run_meta_path, self._run_meta, indent=False)
 
             # Active state clean-up
+            self._forget_run(self._active_run_id)
             self._active_run_id = None
             self._active_experiment_id = None
+            self._active_run_path = None
+            self._metric_ids = {}
+            self._metric_steps = {}
+            self._run_meta = None
 
     def get_run_details(self, run_id: str) -> Optional[Dict]:
         """Loads all details for a specific run.
@@ -340,41 +714,37 @@ class RuneLog:
             Optional[Dict]: A dictionary containing the run's 'params',
                 'metrics', and 'artifacts', or None if the run is not found.
         """
-        run_path = None
-        for exp_id in os.listdir(self._mlruns_dir):
-            path = os.path.join(self._mlruns_dir, exp_id, run_id)
-            if os.path.isdir(path):
-                run_path = path
-                break
+        run_path = self._get_run_path_by_id(run_id)
         if not run_path:
             return None  # Run not found
 
+        return self._read_run_cached("details", run_id, run_path, self._read_run_details)
+
+    def _read_run_details(self, run_id: str, run_path: str) -> Dict:
+        """Reads the metadata, params, metrics and artifact names of a run.
+
+        Args:
+            run_id (str): The ID of the run.
+            run_path (str): The absolute path to the run's directory.
+
+        Returns:
+            Dict: The run's 'meta', 'params', 'metrics' and 'artifacts'.
+        """
         meta = {}
-        meta_path = os.path.join(run_path, "meta.json")
-        if os.path.exists(meta_path):
-            with open(meta_path, "r") as f:
-                meta = json.load(f)
-
-        params = {}
-        params_path = os.path.join(run_path, "params")
-        if os.path.exists(params_path):
-            for param_file in os.listdir(params_path):
-                key = os.path.splitext(param_file)[0]
-                with open(os.path.join(params_path, param_file), "r") as f:
-                    params[key] = json.load(f)["value"]
-
-        metrics = {}
-        metrics_path = os.path.join(run_path, "metrics")
-        if os.path.exists(metrics_path):
-            for metric_file in os.listdir(metrics_path):
-                key = os.path.splitext(metric_file)[0]
-                with open(os.path.join(metrics_path, metric_file), "r") as f:
-                    metrics[key] = json.load(f)["value"]
+        try:
+            with open(os.path.join(run_path, "meta.json"), "rb") as f:
+                meta = jsonio.loads(f.read())
+        except FileNotFoundError:
+            pass
+
+        params = self._read_run_values(run_path, "params")
+        metrics = self._read_run_values(run_path, "metrics")
 
         artifacts = []
-        artifacts_path = os.path.join(run_path, "artifacts")
-        if os.path.exists(artifacts_path):
-            artifacts = os.listdir(artifacts_path)
+        try:
+            artifacts = os.listdir(os.path.join(run_path, "artifacts"))
+        except FileNotFoundError:
+            pass
 
         return {
             "meta": meta,
@@ -399,7 +769,12 @@ class RuneLog:
         if not run_path:
             raise exceptions.RunNotFound(run_id)
 
-        shutil.rmtree(run_path)
+        self._remove_dir(run_path)
+        self._forget_run(run_id)
+
+        self._read_index()
+        if self._run_index.pop(run_id, None) is not None:
+            self._try_write_index()
 
     def get_experiment_runs(
         self,
@@ -421,30 +796,37 @@ class RuneLog:
         runs = []
         exp_path = os.path.join(self._mlruns_dir, experiment_id)
 
-        if not os.path.isdir(exp_path):
+        try:
+            with os.scandir(exp_path) as entries:
+                run_dirs = [entry for entry in entries if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             return runs
 
-        for run_id in os.listdir(exp_path):
-            run_path = os.path.join(exp_path, run_id)
-            meta_path = os.path.join(run_path, "meta.json")
+        # Index runs missing from the runs index while their experiment is known
+        self._add_runs_to_index([entry.name for entry in run_dirs], experiment_id)
 
-            if os.path.isfile(meta_path):
-                try:
-                    with open(meta_path, "r") as f:
-                        run_data = json.load(f)
+        for entry in run_dirs:
+            run_id = entry.name
+            meta_path = f"{entry.path}{os.sep}meta.json"
 
-                    run_data["run_id"] = run_id
+            try:
+                with open(meta_path, "rb") as f:
+                    run_data = jsonio.loads(f.read())
+            except FileNotFoundError:
+                continue
+            except jsonio.JSONDecodeError:
+                print(
+                    f"Warning: Could not parse meta.json for run_id '{run_id}'. Skipping."
+                )
+                continue
 
-                    if run_data.get("timestamp") is None:
-                        ts = os.path.getmtime(meta_path)
-                        run_data["timestamp"] = datetime.fromtimestamp(ts).isoformat()
+            run_data["run_id"] = run_id
 
-                    runs.append(run_data)
-                except json.JSONDecodeError:
-                    print(
-                        f"Warning: Could not parse meta.json for run_id '{run_id}'. Skipping."
-                    )
-                    continue
+            if run_data.get("timestamp") is None:
+                ts = os.path.getmtime(meta_path)
+                run_data["timestamp"] = datetime.fromtimestamp(ts).isoformat()
+
+            runs.append(run_data)
 
         if sort_by:
             fallback_sort_value = (
@@ -485,27 +867,31 @@ class RuneLog:
             exp_name = exp.get("name", "—")
             exp_path = os.path.join(self._mlruns_dir, exp_id)
 
+            with os.scandir(exp_path) as entries:
+                run_dirs = [entry.path for entry in entries if entry.is_dir()]
+
             run_timestamps = []
-            for item in os.listdir(exp_path):
-                run_path = os.path.join(exp_path, item)
-                if os.path.isdir(run_path):
-                    meta_path = os.path.join(run_path, "meta.json")
-                    if os.path.exists(meta_path):
-                        with open(meta_path, "r") as f:
-                            meta = json.load(f)
-                            ts = meta.get("timestamp")
-                            if ts is None:
-                                ts = os.path.getmtime(meta_path)
-                                ts = datetime.fromtimestamp(ts).isoformat()
-                            run_timestamps.append(ts)
+            for run_path in run_dirs:
+                meta_path = f"{run_path}{os.sep}meta.json"
+                try:
+                    with open(meta_path, "rb") as f:
+                        meta = jsonio.loads(f.read())
+                        ts = meta.get("timestamp")
+                        if ts is None:
+                            # Stat the open file rather than looking up its path again
+                            ts = os.fstat(f.fileno()).st_mtime
+                            ts = datetime.fromtimestamp(ts).isoformat()
+                except FileNotFoundError:
+                    continue
+                run_timestamps.append(ts)
 
             last_run = max(run_timestamps, default=None)
-            created_at_path = os.path.join(exp_path, "meta.json")
-            created_at = None
-            if os.path.exists(created_at_path):
+            try:
                 created_at = datetime.fromtimestamp(
-                    os.path.getmtime(created_at_path)
+                    os.stat(os.path.join(exp_path, "meta.json")).st_mtime
                 ).isoformat()
+            except FileNotFoundError:
+                created_at = None
 
             summaries.append(
                 {
@@ -523,35 +909,119 @@ class RuneLog:
 
     # Logging
 
-    def log_param(self, key: str, value):
+    def _append_to_run_log(self, kind: str, entry: Dict, flush: bool = False) -> None:
+        """Appends an entry to one of the active run's JSON Lines logs.
+
+        Args:
+            kind (str): "params", "metrics" or "metric_names".
+            entry (Dict): The entry to append, with at least a 'key'.
+            flush (bool, optional): Whether to write the entry to the file
+                now instead of buffering it. Defaults to False.
+
+        Raises:
+            exceptions.NoActiveRun: If called outside of an active run context.
+        """
+        log_file = self._run_logs.get(kind)
+        if log_file is None:
+            log_file = open(
+                os.path.join(self._get_run_path(), f"{kind}.jsonl"),
+                "ab",
+                buffering=self._LOG_BUFFER_SIZE,
+            )
+            self._run_logs[kind] = log_file
+        log_file.write(jsonio.dumps_line(entry))
+        if flush:
+            log_file.flush()
+
+    def _flush_run_logs(self, run_path: str) -> None:
+        """Writes the buffered params and metrics of `run_path` if it is active."""
+        if run_path != self._active_run_path:
+            return
+        for log_file in self._run_logs.values():
+            log_file.flush()
+        if self._metric_records is not None:
+            self._metric_records.flush()
+
+    def log_param(self, key: str, value, flush: bool = False):
         """Logs a single parameter for the active run.
 
+        Each call appends the value to the run's `params.jsonl` file. Logging
+        the same key again overrides its earlier value. Values are buffered
+        and written in batches, and at the latest when the run ends.
+
         Args:
             key (str): The name of the parameter.
             value (Any): The value of the parameter. Must be JSON-serializable.
+            flush (bool, optional): Whether to write the value to disk now,
+                so it is kept if the process crashes. Defaults to False.
 
         Raises:
             exceptions.NoActiveRun: If called outside of an active run context.
         """
-        run_path = self._get_run_path()
-        param_path = os.path.join(run_path, "params", f"{key}.json")
-        with open(param_path, "w") as f:
-            json.dump({"value": value}, f, indent=4)
+        self._append_to_run_log("params", {"key": key, "value": value}, flush)
 
-    def log_metric(self, key: str, value: float):
+    def log_metric(
+        self, key: str, value: float, step: Optional[int] = None, flush: bool = False
+    ):
         """Logs a single metric for the active run.
 
+        Each call appends the value to the run's metrics, so logging the same
+        key again keeps its earlier values as history. See
+        `get_metric_history()`.
+
+        Floats are appended to the run's `metrics.bin` file as fixed-size
+        binary records. Metric names are stored once, in `metric_names.jsonl`.
+        Other values, including integers so they read back exactly, are
+        appended to `metrics.jsonl`.
+        Values are buffered and written in batches, and at the latest when the
+        run ends.
+
         Args:
             key (str): The name of the metric.
             value (float): The value of the metric.
+            step (Optional[int], optional): The step, e.g. the epoch, the value
+                belongs to. Defaults to one past the metric's previous step,
+                starting at 0.
+            flush (bool, optional): Whether to write the value to disk now,
+                so it is kept if the process crashes. Defaults to False.
 
         Raises:
             exceptions.NoActiveRun: If called outside of an active run context.
         """
         run_path = self._get_run_path()
-        metric_path = os.path.join(run_path, "metrics", f"{key}.json")
-        with open(metric_path, "w") as f:
-            json.dump({"value": value}, f, indent=4)
+        if step is None:
+            step = self._metric_steps.get(key, 0)
+        self._metric_steps[key] = step + 1
+
+        if type(value) is not float and (
+            isinstance(value, numbers.Integral) or not isinstance(value, numbers.Real)
+        ):
+            if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+                # e.g. numpy integers, which the json module can't serialize
+                value = int(value)
+            self._append_to_run_log(
+                "metrics",
+                {"key": key, "value": value, "step": step, "timestamp": time.time()},
+                flush,
+            )
+            return
+
+        metric_id = self._metric_ids.get(key)
+        if metric_id is None:
+            # Names are written straight away, before any record that uses them
+            metric_id = self._metric_ids[key] = len(self._metric_ids)
+            self._append_to_run_log("metric_names", {"key": key}, flush=True)
+
+        records = self._metric_records
+        if records is None:
+            records = self._metric_records = open(
+                os.path.join(run_path, "metrics.bin"),
+                "ab",
+                buffering=self._LOG_BUFFER_SIZE,
+            )
+        records.write(_METRIC_RECORD.pack(metric_id, step, time.time(), value))
+        if flush:
+            records.flush()
 
     def log_artifact(self, local_path: str):
         """Logs a local file as an artifact of the active run.
@@ -565,27 +1035,93 @@ class RuneLog:
             exceptions.ArtifactNotFound: If the file at `local_path` does not exist.
         """
         run_path = self._get_run_path()
-        artifact_dir = os.path.join(run_path, "artifacts")
-        if not os.path.exists(local_path):
+        artifact_path = os.path.join(
+            run_path, "artifacts", os.path.basename(local_path)
+        )
+        try:
+            # Permission bits and timestamps aren't copied, only the data
+            self._write_artifact(
+                artifact_path, lambda tmp_path: self._copy_file(local_path, tmp_path)
+            )
+        except FileNotFoundError:
             raise exceptions.ArtifactNotFound(local_path)
-        shutil.copy(local_path, artifact_dir)
 
-    def log_model(self, model: Any, name: str, compress: int = 3):
+    def _write_artifact(self, artifact_path: str, write) -> None:
+        """Writes an artifact to a new file that then replaces `artifact_path`.
+
+        Registered models may be hard links to run artifacts, so an artifact
+        that is logged again must not be overwritten in place.
+
+        Args:
+            artifact_path (str): The final path of the artifact.
+            write (Callable[[str], Any]): Writes the artifact to the given
+                temporary path, which keeps the artifact's file extension.
+        """
+        directory, name = os.path.split(artifact_path)
+        tmp_path = os.path.join(directory, f".{secrets.token_hex(4)}.{name}")
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, artifact_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def log_model(self, model: Any, name: str, compress: int = 0):
         """Logs a trained model as an artifact of the active run.
 
+        The model is pickled with protocol 5, so large numpy arrays are
+        written straight from their buffers when it is not compressed.
+
         Args:
             model (Any): The trained model object to be saved (e.g., a
                 scikit-learn model).
             name (str): The filename for the saved model (e.g., "model.pkl").
-            compress (int, optional): The level of compression for joblib from 0 to 9.
-                Defaults to 3.
+            compress (int, optional): The level of compression for joblib from 0 to 9,
+                or a `(method, level)` tuple such as `("lz4", 1)`. Compression
+                makes saving and loading slower. Defaults to 0 (no compression).
 
         Raises:
             exceptions.NoActiveRun: If called outside of an active run context.
         """
+        import joblib
+
         run_path = self._get_run_path()
         model_path = os.path.join(run_path, "artifacts", name)
-        joblib.dump(model, model_path, compress=compress)
+        self._write_artifact(
+            model_path,
+            lambda tmp_path: joblib.dump(
+                model, tmp_path, compress=compress, protocol=5
+            ),
+        )
+
+    def load_model(
+        self, run_id: str, name: str, mmap_mode: Optional[str] = None
+    ) -> Any:
+        """Loads a model logged with `log_model()` from a run's artifacts.
+
+        Args:
+            run_id (str): The ID of the run the model was logged in.
+            name (str): The filename the model was logged under.
+            mmap_mode (Optional[str], optional): Passed to `joblib.load`. With
+                "r", numpy arrays in an uncompressed model are memory-mapped
+                from the file instead of read into memory. See
+                `load_registered_model()`. Defaults to None.
+
+        Returns:
+            Any: The loaded model object.
+
+        Raises:
+            exceptions.RunNotFound: If no run with the given ID is found.
+            exceptions.ArtifactNotFound: If the run has no artifact named `name`.
+        """
+        model_path = self.get_artifact_abspath(run_id, name)
+
+        import joblib
+
+        return joblib.load(model_path, mmap_mode=mmap_mode)
 
     def log_dataset(self, data_path: str, name: str):
         """Logs the hash and metadata of a dataset file.
@@ -608,8 +1144,7 @@ class RuneLog:
         }
 
         meta_path = os.path.join(self._get_run_path(), "data_meta.json")
-        with open(meta_path, "w") as f:
-            json.dump(data_meta, f, indent=4)
+        jsonio.write(meta_path, data_meta)
 
     def log_dvc_input(self, data_path: str, name: str):
         """Logs the version hash of a DVC-tracked file.
@@ -632,6 +1167,8 @@ class RuneLog:
             )
             return
 
+        import yaml
+
         with open(dvc_file_path, "r") as f:
             dvc_meta = yaml.safe_load(f)
 
@@ -647,8 +1184,7 @@ class RuneLog:
             }
 
             meta_path = os.path.join(self._get_run_path(), "dvc_inputs.json")
-            with open(meta_path, "w") as f:
-                json.dump(dvc_info, f, indent=4)
+            jsonio.write(meta_path, dvc_info)
 
     def log_input_run(
         self, name: str, run_id: str, artifact_name: Optional[str] = None
@@ -670,10 +1206,10 @@ class RuneLog:
         # Read lineage data if exists
         lineage_data = []
         if os.path.exists(lineage_path):
-            with open(lineage_path, "r") as f:
+            with open(lineage_path, "rb") as f:
                 content = f.read()
                 if content:
-                    lineage_data = json.loads(content)
+                    lineage_data = jsonio.loads(content)
 
         parent_run_details = self.get_run_details(run_id)
         if not parent_run_details:
@@ -694,8 +1230,7 @@ class RuneLog:
 
         lineage_data.append(input_info)
 
-        with open(lineage_path, "w") as f:
-            json.dump(lineage_data, f, indent=4)
+        jsonio.write(lineage_path, lineage_data)
 
     # Reading
 
@@ -712,8 +1247,8 @@ class RuneLog:
         """
         meta_path = os.path.join(self._mlruns_dir, experiment_id, "meta.json")
         if os.path.exists(meta_path):
-            with open(meta_path, "r") as f:
-                return json.load(f)
+            with open(meta_path, "rb") as f:
+                return jsonio.loads(f.read())
         return None
 
     def get_run(self, run_id: str) -> Optional[Dict]:
@@ -735,39 +1270,326 @@ class RuneLog:
                 associated parameters and metrics, or None if the run is not
                 found. Parameter keys are prefixed with 'param_'.
         """
-        for experiment_id in os.listdir(self._mlruns_dir):
-            run_path = os.path.join(self._mlruns_dir, experiment_id, run_id)
-            if os.path.isdir(run_path):
-                # Load metadata
-                meta = {}
-                meta_path = os.path.join(run_path, "meta.json")
-                if os.path.exists(meta_path):
-                    with open(meta_path, "r") as f:
-                        try:
-                            meta = json.load(f)
-                        except json.JSONDecodeError:
-                            warnings.warn(f"Warning: Corrupted meta.json for run '{run_id}'. Skipping metadata.")
-                            meta = {}
-
-                # Load params
-                params = {}
-                params_path = os.path.join(run_path, "params")
-                for param_file in os.listdir(params_path):
-                    key = os.path.splitext(param_file)[0]
-                    with open(os.path.join(params_path, param_file), "r") as f:
-                        params[f"param_{key}"] = json.load(f)["value"]
-
-                # Load metrics
-                metrics = {}
-                metrics_path = os.path.join(run_path, "metrics")
-                for metric_file in os.listdir(metrics_path):
-                    key = os.path.splitext(metric_file)[0]
-                    with open(os.path.join(metrics_path, metric_file), "r") as f:
-                        metrics[key] = json.load(f)["value"]
-
-                return {"run_id": run_id, **meta, **params, **metrics}
+        run_path = self._get_run_path_by_id(run_id)
+        if run_path:
+            return self._read_run_cached("run", run_id, run_path, self._read_run)
         return None
 
+    def _read_run_cached(self, kind: str, run_id: str, run_path: str, reader) -> Dict:
+        """Returns the result of `reader(run_id, run_path)`, cached per run.
+
+        Writing a run's JSON files replaces them, and logging an artifact adds
+        a file, so either changes the mtime of the run or artifacts directory.
+        Params and metrics are appended to `params.jsonl`, `metrics.jsonl`
+        and `metrics.bin`, whose own mtimes are checked.
+        Cached results are reused while these mtimes are unchanged. The active
+        run is always read from disk.
+
+        Args:
+            kind (str): The kind of result, so readers don't share entries.
+            run_id (str): The ID of the run.
+            run_path (str): The absolute path to the run's directory.
+            reader (Callable[[str, str], Dict]): Reads the run from disk.
+
+        Returns:
+            Dict: A copy of the result, safe for the caller to modify.
+        """
+        if run_id == self._active_run_id:
+            return reader(run_id, run_path)
+
+        try:
+            mtimes = (
+                os.stat(run_path).st_mtime_ns,
+                os.stat(os.path.join(run_path, "artifacts")).st_mtime_ns,
+            )
+        except FileNotFoundError:
+            return reader(run_id, run_path)
+        for log_name in ("params.jsonl", "metrics.jsonl", "metrics.bin"):
+            try:
+                mtimes += (os.stat(os.path.join(run_path, log_name)).st_mtime_ns,)
+            except FileNotFoundError:
+                mtimes += (None,)
+
+        key = (kind, run_id)
+        cached = self._run_cache.get(key)
+        if cached and cached[0] == mtimes:
+            self._run_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+        result = reader(run_id, run_path)
+        self._run_cache[key] = (mtimes, copy.deepcopy(result))
+        if len(self._run_cache) > self._RUN_CACHE_SIZE:
+            self._run_cache.popitem(last=False)
+        return result
+
+    def _forget_run(self, run_id: str) -> None:
+        """Drops any cached `get_run`/`get_run_details` results for a run."""
+        self._run_cache.pop(("run", run_id), None)
+        self._run_cache.pop(("details", run_id), None)
+
+    def _read_run(
+        self, run_id: str, run_path: str, columns: Optional[List[str]] = None
+    ) -> Dict:
+        """Reads the flattened metadata, params and metrics of a run directory.
+
+        Args:
+            run_id (str): The ID of the run.
+            run_path (str): The absolute path to the run's directory.
+            columns (Optional[List[str]], optional): If given, only these
+                fields are read; other param and metric files are not opened.
+                Param fields use the 'param_' prefix. Defaults to None (all).
+
+        Returns:
+            Dict: The `run_id` and the selected metadata, params and metrics.
+        """
+        wanted = set(columns) if columns is not None else None
+
+        # Load metadata. Paths of files read for every run are built by
+        # concatenation, which is cheaper than os.path.join in these loops
+        meta = {}
+        try:
+            with open(f"{run_path}{os.sep}meta.json", "rb") as f:
+                meta = jsonio.loads(f.read())
+        except FileNotFoundError:
+            pass
+        except jsonio.JSONDecodeError:
+            warnings.warn(f"Warning: Corrupted meta.json for run '{run_id}'. Skipping metadata.")
+            meta = {}
+        if wanted is not None:
+            meta = {key: value for key, value in meta.items() if key in wanted}
+
+        # Load params and metrics
+        param_keys = None
+        if wanted is not None:
+            param_keys = {
+                col[len("param_") :] for col in wanted if col.startswith("param_")
+            }
+        params = self._read_run_values(run_path, "params", param_keys)
+        params = {f"param_{key}": value for key, value in params.items()}
+        metrics = self._read_run_values(run_path, "metrics", wanted)
+
+        return {"run_id": run_id, **meta, **params, **metrics}
+
+    def _read_run_values(
+        self, run_path: str, kind: str, keys: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """Reads the params or metrics of a run directory.
+
+        Values are stored in the run's `params.jsonl` log, or its
+        `metrics.bin` and `metrics.jsonl` logs, where the last entry for a key
+        is its value. Runs logged by earlier
+        versions keep a `params.json` or `metrics.json` file, or one
+        `<key>.json` file per value in a `params/` or `metrics/` directory,
+        which are read as a fallback.
+
+        Args:
+            run_path (str): The absolute path to the run's directory.
+            kind (str): Either "params" or "metrics".
+            keys (Optional[set], optional): If given, only these keys are
+                returned. Defaults to None (all keys).
+
+        Returns:
+            Dict[str, Any]: The logged values, keyed by name.
+        """
+        if kind == "metrics":
+            values = self._read_logged_metrics(run_path)
+        else:
+            history = self._read_values_log(run_path, kind)
+            values = None
+            if history is not None:
+                values = {entry["key"]: entry["value"] for entry in history}
+        if values is not None:
+            if keys is not None:
+                values = {key: values[key] for key in keys if key in values}
+            return values
+
+        try:
+            with open(f"{run_path}{os.sep}{kind}.json", "rb") as f:
+                values = jsonio.loads(f.read())
+        except FileNotFoundError:
+            values = {}
+            try:
+                with os.scandir(f"{run_path}{os.sep}{kind}") as entries:
+                    for entry in entries:
+                        key = os.path.splitext(entry.name)[0]
+                        if keys is not None and key not in keys:
+                            continue
+                        with open(entry.path, "rb") as f:
+                            values[key] = jsonio.loads(f.read())["value"]
+            except FileNotFoundError:
+                pass
+
+        if keys is not None:
+            values = {key: value for key, value in values.items() if key in keys}
+        return values
+
+    def _read_values_log(self, run_path: str, kind: str) -> Optional[List[Dict]]:
+        """Reads the entries of one of a run's JSON Lines logs.
+
+        A partially written last line, left by a crash, is ignored.
+
+        Args:
+            run_path (str): The absolute path to the run's directory.
+            kind (str): "params", "metrics" or "metric_names".
+
+        Returns:
+            Optional[List[Dict]]: The entries in logging order, each with a
+                'key', and a 'value' for params and metrics. None if the run
+                has no such log.
+        """
+        self._flush_run_logs(run_path)
+        try:
+            with open(f"{run_path}{os.sep}{kind}.jsonl", "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(jsonio.loads(line))
+            except jsonio.JSONDecodeError:
+                continue
+        return entries
+
+    def _read_metric_records(self, run_path: str):
+        """Reads a run's `metrics.bin` records and the metric names they use.
+
+        A partially written last record, left by a crash, is ignored.
+
+        Args:
+            run_path (str): The absolute path to the run's directory.
+
+        Returns:
+            Optional[Tuple[List[str], numpy.ndarray]]: The metric names,
+                indexed by ID, and a structured array of the records with
+                'id', 'step', 'timestamp' and 'value' fields. None if the run
+                has no `metrics.bin` file.
+        """
+        self._flush_run_logs(run_path)
+        try:
+            with open(f"{run_path}{os.sep}metrics.bin", "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        import numpy as np
+
+        names = [
+            entry["key"]
+            for entry in self._read_values_log(run_path, "metric_names") or []
+        ]
+        dtype = np.dtype(
+            [("id", "<u4"), ("step", "<i8"), ("timestamp", "<f8"), ("value", "<f8")]
+        )
+        records = np.frombuffer(data, dtype=dtype, count=len(data) // dtype.itemsize)
+        return names, records
+
+    @staticmethod
+    def _merge_metric_history(records, logged: Optional[List[Dict]]) -> List[Dict]:
+        """Merges `metrics.bin` records and `metrics.jsonl` entries in logging order.
+
+        Args:
+            records (Optional[Tuple[List[str], numpy.ndarray]]): The result of
+                `_read_metric_records()`.
+            logged (Optional[List[Dict]]): The entries of `metrics.jsonl`.
+
+        Returns:
+            List[Dict]: The entries, each with a 'key', 'value', 'step' and
+                'timestamp'.
+        """
+        history = []
+        if records is not None:
+            names, data = records
+            for metric_id, step, timestamp, value in data.tolist():
+                if metric_id < len(names):
+                    history.append(
+                        {
+                            "key": names[metric_id],
+                            "value": value,
+                            "step": step,
+                            "timestamp": timestamp,
+                        }
+                    )
+        if logged:
+            history.extend(logged)
+            history.sort(key=lambda entry: entry.get("timestamp") or 0)
+        return history
+
+    def _read_logged_metrics(self, run_path: str) -> Optional[Dict[str, Any]]:
+        """Reads the last value of each metric from a run's metric logs.
+
+        Args:
+            run_path (str): The absolute path to the run's directory.
+
+        Returns:
+            Optional[Dict[str, Any]]: The values keyed by name, or None if the
+                run has neither a `metrics.bin` nor a `metrics.jsonl` log.
+        """
+        records = self._read_metric_records(run_path)
+        logged = self._read_values_log(run_path, "metrics")
+        if records is None:
+            if logged is None:
+                return None
+            return {entry["key"]: entry["value"] for entry in logged}
+
+        if not logged:
+            import numpy as np
+
+            # The first occurrence of each ID in the reversed records is its
+            # last value
+            names, data = records
+            ids, index = np.unique(data["id"][::-1], return_index=True)
+            values = data["value"][::-1][index]
+            return {
+                names[metric_id]: value
+                for metric_id, value in zip(ids.tolist(), values.tolist())
+                if metric_id < len(names)
+            }
+
+        history = self._merge_metric_history(records, logged)
+        return {entry["key"]: entry["value"] for entry in history}
+
+    def get_metric_history(self, run_id: str, key: str) -> List[Dict]:
+        """Returns every value logged for a metric of a run.
+
+        Args:
+            run_id (str): The ID of the run.
+            key (str): The name of the metric.
+
+        Returns:
+            List[Dict]: The logged entries in order, each with a 'value', its
+                'step' and the ISO 'timestamp' it was logged at. Runs logged
+                by earlier versions only kept the last value, which is
+                returned alone with a 'step' and 'timestamp' of None.
+
+        Raises:
+            exceptions.RunNotFound: If no run with the given ID is found.
+        """
+        run_path = self._get_run_path_by_id(run_id)
+        if not run_path:
+            raise exceptions.RunNotFound(run_id)
+
+        records = self._read_metric_records(run_path)
+        logged = self._read_values_log(run_path, "metrics")
+        if records is None and logged is None:
+            metrics = self._read_run_values(run_path, "metrics", {key})
+            if key not in metrics:
+                return []
+            return [{"value": metrics[key], "step": None, "timestamp": None}]
+
+        history = []
+        for entry in self._merge_metric_history(records, logged):
+            if entry.get("key") != key:
+                continue
+            timestamp = entry.get("timestamp")
+            if timestamp is not None:
+                timestamp = datetime.fromtimestamp(timestamp).isoformat()
+            history.append(
+                {"value": entry["value"], "step": entry.get("step"), "timestamp": timestamp}
+            )
+        return history
+
     def get_run_tags(self) -> Dict:
         """Retrieves the tags for the active run.
 
@@ -775,11 +1597,8 @@ class RuneLog:
             Dict: A dictionary of the run's tags. Returns an empty dict if
                 no tags are set.
         """
-        run_path = self._get_run_path()
-        meta_path = os.path.join(run_path, "meta.json")
-        with open(meta_path, "r") as f:
-            meta = json.load(f)
-        return meta.get("tags", {})
+        self._get_run_path()
+        return copy.deepcopy(self._run_meta.get("tags", {}))
 
     def set_run_tags(self, tags: Dict):
         """Sets the entire tag dictionary for the active run.
@@ -790,15 +1609,9 @@ class RuneLog:
             tags (Dict): The dictionary of tags to set for the run.
         """
         run_path = self._get_run_path()
-        meta_path = os.path.join(run_path, "meta.json")
-        
-        with open(meta_path, "r+") as f:
-            meta = json.load(f)
-            meta["tags"] = tags # Overwrite the entire tags dictionary
-            
-            f.seek(0)
-            json.dump(meta, f, indent=4)
-            f.truncate()
+        # Overwrite the entire tags dictionary
+        self._run_meta["tags"] = copy.deepcopy(tags)
+        jsonio.write(os.path.join(run_path, "meta.json"), self._run_meta, indent=False)
 
     def _resolve_experiment_id(self, name_or_id: str) -> str:
         """
@@ -817,11 +1630,9 @@ class RuneLog:
         if os.path.isdir(path):
             return name_or_id, path
 
-        for experiment in self.list_experiments():
-            if experiment.get("name") == name_or_id:
-                exp_id = experiment["experiment_id"]
-                path = os.path.join(self._mlruns_dir, exp_id)
-                return exp_id, path
+        exp_id = self._find_experiment_id(name_or_id)
+        if exp_id is not None:
+            return exp_id, os.path.join(self._mlruns_dir, exp_id)
 
         raise exceptions.ExperimentNotFound(name_or_id)
 
@@ -830,7 +1641,9 @@ class RuneLog:
         experiment_name_or_id: str,
         sort_by: Optional[str] = None,
         ascending: bool = True,
-    ) -> pd.DataFrame:
+        columns: Optional[List[str]] = None,
+        parallel: bool = True,
+    ) -> "pd.DataFrame":
         """Loads all run data from an experiment into a pandas DataFrame.
 
         Args:
@@ -838,6 +1651,11 @@ class RuneLog:
             sort_by (Optional[str], optional): Column to sort the DataFrame by.
                 Defaults to None (sort by run_id index).
             ascending (bool, optional): Sort order. Defaults to True.
+            columns (Optional[List[str]], optional): Columns to load, e.g.
+                `["accuracy", "param_alpha"]`. Params and metrics outside this
+                list are not read from disk. Defaults to None (all columns).
+            parallel (bool, optional): Read runs that aren't in the results
+                summary with a thread pool. Defaults to True.
 
         Returns:
             pd.DataFrame: A DataFrame containing the parameters and metrics
@@ -851,29 +1669,292 @@ class RuneLog:
         experiment_id, experiment_path = self._resolve_experiment_id(
             experiment_name_or_id
         )
-        if not os.path.exists(experiment_path):
+
+        # The sort column is read even if it wasn't requested
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns) + ([sort_by] if sort_by else [])
+
+        try:
+            with os.scandir(experiment_path) as entries:
+                # Skip metadata files, only process run directories
+                run_paths = {
+                    entry.name: entry.path for entry in entries if entry.is_dir()
+                }
+        except FileNotFoundError:
             raise exceptions.ExperimentNotFound(experiment_id)
 
-        all_runs_data = []
-        for run_id in os.listdir(experiment_path):
-            # Skip metadata file, only process run directories
-            if os.path.isdir(os.path.join(experiment_path, run_id)):
-                run_data = self.get_run(run_id)
-                if run_data:
-                    all_runs_data.append(run_data)
+        import pandas as pd
 
-        if not all_runs_data:
+        # Finished runs come from the summary, the rest are read from disk
+        summary = self._read_results_summary(experiment_path, run_paths, read_columns)
+        summarized = set(summary.index) if summary is not None else set()
+        pending = [
+            (run_id, run_path)
+            for run_id, run_path in run_paths.items()
+            if run_id not in summarized
+        ]
+        pending_runs_data = self._read_runs(pending, read_columns, parallel)
+
+        # Finished runs missing from the summary, e.g. logged before it
+        # existed, are added to it so that later calls don't read them again
+        if columns is None:
+            finished = [
+                row for row in pending_runs_data if row.get("status") == "FINISHED"
+            ]
+            if finished:
+                self._update_results_summary(experiment_path, finished)
+
+        # Index runs missing from the runs index while their experiment is
+        # known, so later lookups by run ID don't search every experiment
+        self._add_runs_to_index(list(run_paths), experiment_id)
+
+        frames = [] if summary is None or summary.empty else [summary]
+        if pending_runs_data:
+            frames.append(
+                pd.DataFrame(self._rows_to_columns(pending_runs_data)).set_index(
+                    "run_id"
+                )
+            )
+        if not frames:
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_runs_data).set_index("run_id")
+        df = frames[0] if len(frames) == 1 else pd.concat(frames)
 
         if sort_by and sort_by in df.columns:
             df.sort_values(by=sort_by, ascending=ascending, inplace=True)
         else:
             df.sort_index(inplace=True)
 
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+
         return df
 
+    @staticmethod
+    def _rows_to_columns(rows: List[Dict]) -> Dict[str, List]:
+        """Converts run rows into one list of values per column.
+
+        Keys missing from a row are filled with NaN, so every column has one
+        value per row and can be handed to pandas without per-row inference.
+
+        Args:
+            rows (List[Dict]): Run rows in the format returned by `_read_run`.
+
+        Returns:
+            Dict[str, List]: The values of each column, in row order. Columns
+                are ordered by first appearance, starting with `run_id`.
+        """
+        names = {"run_id": None}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+
+        missing = float("nan")
+        return {name: [row.get(name, missing) for row in rows] for name in names}
+
+    def _read_runs(
+        self,
+        run_paths: List[Tuple[str, str]],
+        columns: Optional[List[str]] = None,
+        parallel: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Reads several runs with `_read_run`, in parallel when there are many.
+
+        Reading a run is dominated by opening small files, so a thread pool
+        overlaps the per-file latency of the runs.
+        """
+        if not parallel or len(run_paths) < 2:
+            return [self._read_run(run_id, path, columns) for run_id, path in run_paths]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(32, len(run_paths), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda item: self._read_run(item[0], item[1], columns), run_paths
+                )
+            )
+
+    def _update_results_summary(
+        self, experiment_path: str, new_rows: List[Dict[str, Any]]
+    ) -> None:
+        """Adds finished runs to an experiment's `runs.parquet` summary.
+
+        The summary is a derived index that lets `load_results` read finished
+        runs from one columnar file instead of opening every run's params and
+        metrics. It is written by `load_results` for the finished runs it had
+        to read from disk, so finishing a run doesn't rewrite it. The JSON
+        files remain the source of truth: the summary is skipped if `pyarrow`
+        is not installed or the directory is read-only, and removed if the
+        runs' values can't be stored alongside the existing rows.
+
+        Columns holding dicts, lists or tuples, e.g. tags, or values of
+        different types, e.g. a param logged as an int in one run and as a
+        str in another, are stored as JSON strings and listed in the file's
+        metadata. They read back exactly as `_read_run` returns them rather
+        than as Arrow structs and lists, or failing to share an Arrow type.
+
+        Args:
+            experiment_path (str): The absolute path to the experiment.
+            new_rows (List[Dict[str, Any]]): Rows of the runs as returned by
+                `_read_run`. They replace any existing rows of the same runs.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            return
+
+        summary_path = os.path.join(experiment_path, "runs.parquet")
+
+        with os.scandir(experiment_path) as entries:
+            existing_runs = {entry.name for entry in entries if entry.is_dir()}
+        new_run_ids = {row["run_id"] for row in new_rows}
+
+        rows = []
+        if os.path.exists(summary_path):
+            try:
+                table = pq.read_table(summary_path)
+                rows = [
+                    row
+                    for row in self._decode_summary_rows(table)
+                    if row["run_id"] not in new_run_ids
+                    and row["run_id"] in existing_runs
+                ]
+            except (pa.ArrowException, OSError, KeyError, jsonio.JSONDecodeError):
+                rows = []  # Rebuilt from the runs read from now on
+        rows.extend(new_rows)
+
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        values = {col: [row.get(col) for row in rows] for col in columns}
+        json_columns = [
+            col for col, col_values in values.items() if self._needs_json(col_values)
+        ]
+        for col in json_columns:
+            values[col] = [
+                None if value is None else jsonio.dumps(value, indent=False).decode()
+                for value in values[col]
+            ]
+
+        # Unique, so concurrent writers don't share the file
+        tmp_path = f"{summary_path}.{secrets.token_hex(4)}.tmp"
+        try:
+            table = pa.table(values)
+            table = table.replace_schema_metadata(
+                {self._SUMMARY_JSON_COLUMNS_KEY: jsonio.dumps(json_columns, False)}
+            )
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, summary_path)
+        except (pa.ArrowException, OverflowError):
+            # e.g. a param logged with different types across runs
+            for path in (tmp_path, summary_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # Key of the summary's schema metadata listing its JSON-encoded columns
+    _SUMMARY_JSON_COLUMNS_KEY = b"runelog.json_columns"
+
+    @staticmethod
+    def _needs_json(values: List[Any]) -> bool:
+        """Returns whether a summary column must be stored as JSON strings.
+
+        That is the case for columns holding dicts, lists or tuples, integers
+        beyond 64 bits, or values Arrow can't give a common type, e.g. ints
+        and strs. Ints and floats share a float column, as they do in pandas.
+        """
+        kinds = set()
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, (dict, list, tuple)):
+                return True
+            if isinstance(value, bool):
+                kinds.add(bool)
+            elif isinstance(value, int):
+                if not -(2**63) <= value < 2**63:
+                    return True
+                kinds.add(float)
+            else:
+                kinds.add(type(value))
+            if len(kinds) > 1:
+                return True
+        return False
+
+    @classmethod
+    def _summary_json_columns(cls, schema) -> List[str]:
+        """Returns the JSON-encoded columns listed in a summary's schema."""
+        encoded = (schema.metadata or {}).get(cls._SUMMARY_JSON_COLUMNS_KEY)
+        return jsonio.loads(encoded) if encoded else []
+
+    @classmethod
+    def _decode_summary_rows(cls, table) -> List[Dict[str, Any]]:
+        """Converts a summary table to rows, decoding its JSON columns."""
+        json_columns = cls._summary_json_columns(table.schema)
+        rows = table.to_pylist()
+        for row in rows:
+            for col in json_columns:
+                if row.get(col) is not None:
+                    row[col] = jsonio.loads(row[col])
+        return rows
+
+    def _read_results_summary(
+        self,
+        experiment_path: str,
+        run_paths: Dict[str, str],
+        columns: Optional[List[str]] = None,
+    ) -> Optional["pd.DataFrame"]:
+        """Reads the rows of an experiment's `runs.parquet` summary.
+
+        Args:
+            experiment_path (str): The absolute path to the experiment.
+            run_paths (Dict[str, str]): The run directories currently on disk.
+                Summary rows for runs that no longer exist are dropped.
+            columns (Optional[List[str]], optional): Columns to read.
+                Defaults to None (all columns).
+
+        Returns:
+            Optional[pd.DataFrame]: The summarized runs, indexed by `run_id`,
+                with the same columns `_read_run` returns. Missing values
+                are NaN or None. None if there is no usable summary.
+        """
+        summary_path = os.path.join(experiment_path, "runs.parquet")
+        if not os.path.exists(summary_path):
+            return None
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.parquet as pq
+        except ImportError:
+            return None
+
+        try:
+            read_columns = None
+            if columns is not None:
+                schema_names = set(pq.read_schema(summary_path).names)
+                read_columns = ["run_id"] + [
+                    col for col in columns if col in schema_names and col != "run_id"
+                ]
+            table = pq.read_table(summary_path, columns=read_columns)
+            # Rows of runs that no longer exist are dropped
+            table = table.filter(
+                pc.is_in(table["run_id"], value_set=pa.array(list(run_paths)))
+            )
+            df = table.to_pandas().set_index("run_id")
+            for col in self._summary_json_columns(table.schema):
+                if col in df.columns:
+                    df[col] = df[col].map(
+                        lambda value: jsonio.loads(value) if isinstance(value, str) else value
+                    )
+            return df
+        except (pa.ArrowException, OSError, KeyError, jsonio.JSONDecodeError):
+            return None
+
     # Model Registry
 
     def register_model(
@@ -898,57 +1979,74 @@ class RuneLog:
                 in the run.
         """
         # Find the model artifact
-        run_path = None
-        for exp_id in os.listdir(self._mlruns_dir):
-            path = os.path.join(self._mlruns_dir, exp_id, run_id)
-            if os.path.isdir(path):
-                run_path = path
-                break
-
+        run_path = self._get_run_path_by_id(run_id)
         if not run_path:
             raise exceptions.RunNotFound(run_id)
 
+        # Opening the artifact up front checks that it exists before anything
+        # is created in the registry
         source_artifact_path = os.path.join(run_path, "artifacts", artifact_name)
-        if not os.path.exists(source_artifact_path):
+        try:
+            source_artifact = open(source_artifact_path, "rb")
+        except FileNotFoundError:
             raise exceptions.ArtifactNotFound(
                 artifact_path=artifact_name, run_id=run_id
             )
 
-        registry_model_path = os.path.join(self._registry_dir, model_name)
-        os.makedirs(registry_model_path, exist_ok=True)
-
-        # Determine the new version number
-        existing_versions = [d for d in os.listdir(registry_model_path) if d.isdigit()]
-        new_version = str(max([int(v) for v in existing_versions] or [0]) + 1)
+        with source_artifact:
+            registry_model_path = os.path.join(self._registry_dir, model_name)
+            os.makedirs(registry_model_path, exist_ok=True)
 
-        version_path = os.path.join(registry_model_path, new_version)
-        os.makedirs(version_path, exist_ok=True)
+            # Determine the new version number. Creating the directory claims
+            # the version, so a taken number moves on to the next one
+            latest_version = self._get_latest_version_number(registry_model_path)
+            new_version = str(latest_version + 1)
+            version_path = os.path.join(registry_model_path, new_version)
+            while True:
+                try:
+                    os.mkdir(version_path)
+                    break
+                except FileExistsError:
+                    new_version = str(int(new_version) + 1)
+                    version_path = os.path.join(registry_model_path, new_version)
 
-        # Copy the model and generate metadata
-        shutil.copy(source_artifact_path, os.path.join(version_path, "model.joblib"))
+            # Link or copy the model and generate metadata
+            model_path = os.path.join(version_path, "model.joblib")
+            self._link_or_copy(source_artifact_path, model_path)
 
         meta = {
             "model_name": model_name,
             "version": new_version,
             "source_run_id": run_id,
-            "registration_timestamp": __import__("datetime").datetime.now().isoformat(),
+            "registration_timestamp": datetime.now(timezone.utc).isoformat(),
             "tags": tags or {},
         }
-        with open(os.path.join(version_path, "meta.json"), "w") as f:
-            json.dump(meta, f, indent=4)
+        jsonio.write(os.path.join(version_path, "meta.json"), meta)
+        jsonio.write(
+            os.path.join(registry_model_path, "_meta.json"),
+            {"latest_version": int(new_version)},
+        )
+        self._versions_cache.pop(model_name, None)
 
         print(
             f"Successfully registered model '{model_name}' with version {new_version}."
         )
         return new_version
 
-    def load_registered_model(self, model_name: str, version: str = "latest") -> Any:
+    def load_registered_model(
+        self, model_name: str, version: str = "latest", mmap_mode: Optional[str] = None
+    ) -> Any:
         """Loads a model from the model registry.
 
         Args:
             model_name (str): The name of the registered model.
             version (str, optional): The version to load. Can be a specific
                 version number or "latest". Defaults to "latest".
+            mmap_mode (Optional[str], optional): Passed to `joblib.load`. With
+                "r", numpy arrays in an uncompressed model are memory-mapped
+                from the file instead of read into memory, which makes loading
+                large models faster. The arrays are then read-only; copy them
+                with `np.array(x)` before modifying them. Defaults to None.
 
         Returns:
             Any: The loaded model object.
@@ -964,11 +2062,10 @@ class RuneLog:
             raise exceptions.ModelNotFound(model_name)
 
         if version == "latest":
-            versions = [d for d in os.listdir(model_path) if d.isdigit()]
-            if not versions:
+            latest_version = self._get_latest_version_number(model_path)
+            if not latest_version:
                 raise exceptions.NoVersionsFound(model_name)
-            latest_version = str(max([int(v) for v in versions]))
-            version_to_load = latest_version
+            version_to_load = str(latest_version)
         else:
             version_to_load = version
 
@@ -978,7 +2075,9 @@ class RuneLog:
                 model_name=model_name, version=version_to_load
             )
 
-        return joblib.load(final_model_path)
+        import joblib
+
+        return joblib.load(final_model_path, mmap_mode=mmap_mode)
 
     def add_model_tags(self, model_name: str, version: str, tags: dict) -> Dict:
         """Retrieves the tags for a specific registered model version.
@@ -993,23 +2092,16 @@ class RuneLog:
         Raises:
             exceptions.ModelVersionNotFound: If the model or version is not found.
         """
-        version_path = os.path.join(self._registry_dir, model_name, version)
-        meta_path = os.path.join(version_path, "meta.json")
-
-        if not os.path.exists(meta_path):
-            raise exceptions.ModelVersionNotFound(
-                model_name=model_name, version=version
-            )
-
-        with open(meta_path, "r+") as f:
-            meta = json.load(f)
-            if "tags" not in meta:
-                meta["tags"] = {}
-            meta["tags"].update(tags)  # Add or overwrite tags
+        meta = self._read_version_meta(model_name, version)
+        if "tags" not in meta:
+            meta["tags"] = {}
+        meta["tags"].update(tags)  # Add or overwrite tags
+        jsonio.write(
+            os.path.join(self._registry_dir, model_name, version, "meta.json"), meta
+        )
 
-            f.seek(0)  # Rewind to the beginning of the file
-            json.dump(meta, f, indent=4)
-            f.truncate()  # Remove any trailing content if the new file is shorter
+        # Tag edits don't change the model directory's mtime
+        self._versions_cache.pop(model_name, None)
 
     def get_model_tags(self, model_name: str, version: str) -> dict:
         """Retrieves the tags for a specific registered model version.
@@ -1024,33 +2116,35 @@ class RuneLog:
         Raises:
             exceptions.ModelVersionNotFound: If the model or version is not found.
         """
-        version_path = os.path.join(self._registry_dir, model_name, version)
-        meta_path = os.path.join(version_path, "meta.json")
+        return self._read_version_meta(model_name, version).get("tags", {})
 
-        if not os.path.exists(meta_path):
+    def _read_version_meta(self, model_name: str, version: str) -> Dict:
+        """Reads a model version's `meta.json` in a single open and read.
+
+        Raises:
+            exceptions.ModelVersionNotFound: If the file does not exist.
+        """
+        meta_path = os.path.join(self._registry_dir, model_name, version, "meta.json")
+        try:
+            with open(meta_path, "rb") as f:
+                return jsonio.loads(f.read())
+        except FileNotFoundError:
             raise exceptions.ModelVersionNotFound(
                 model_name=model_name, version=version
             )
 
-        with open(meta_path, "r") as f:
-            meta = json.load(f)
-            return meta.get("tags", {})
-
     def list_registered_models(self, ascending: bool = True) -> List[str]:
         """Lists the names of all models in the registry.
 
         Returns:
             List[str]: A list of names of all registered models.
         """
-        if not os.path.exists(self._registry_dir):
-            return []
-
         # Returns a list of model names (directory names)
-        model_names = [
-            d
-            for d in os.listdir(self._registry_dir)
-            if os.path.isdir(os.path.join(self._registry_dir, d))
-        ]
+        try:
+            with os.scandir(self._registry_dir) as entries:
+                model_names = [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
         model_names.sort(reverse=not ascending)
 
         return model_names
@@ -1077,23 +2171,44 @@ class RuneLog:
                 list if the model is not found.
         """
         model_path = os.path.join(self._registry_dir, model_name)
-        if not os.path.exists(model_path):
+        try:
+            versions = sorted(self._list_versions(model_path))
+        except FileNotFoundError:
             return []
 
-        versions_data = []
-        versions = [d for d in os.listdir(model_path) if d.isdigit()]
+        # Registering a version adds a `meta.json`, and tagging one, also from
+        # another process, replaces it, so both change the stamps
+        meta_paths = [
+            os.path.join(model_path, str(version), "meta.json") for version in versions
+        ]
+        stamps = []
+        for meta_path in meta_paths:
+            try:
+                stat = os.stat(meta_path)
+            except FileNotFoundError:
+                stamps.append(None)
+                continue
+            stamps.append((stat.st_ino, stat.st_mtime_ns))
+
+        cached = self._versions_cache.get(model_name)
+        if cached and cached[0] == stamps:
+            versions_data = copy.deepcopy(cached[1])
+        else:
+            versions_data = []
+            for meta_path in meta_paths:
+                try:
+                    with open(meta_path, "rb") as f:
+                        versions_data.append(jsonio.loads(f.read()))
+                except FileNotFoundError:
+                    continue
 
-        for version in versions:
-            meta_path = os.path.join(model_path, version, "meta.json")
-            if os.path.exists(meta_path):
-                with open(meta_path, "r") as f:
-                    versions_data.append(json.load(f))
+            self._versions_cache[model_name] = (stamps, copy.deepcopy(versions_data))
 
         if sort_by:
             if sort_by == "version":
-                versions_data.sort(
-                    key=lambda x: int(x.get("version", 0)), reverse=not ascending
-                )
+                # Versions are read in ascending order of their directory number
+                if not ascending:
+                    versions_data.reverse()
             else:
                 versions_data.sort(
                     key=lambda x: str(x.get(sort_by, "")), reverse=not ascending
@@ -1101,6 +2216,75 @@ class RuneLog:
 
         return versions_data
 
+    def get_latest_model_version(self, model_name: str) -> Optional[Dict]:
+        """Gets the metadata for the newest version of a registered model.
+
+        Unlike `get_model_versions()`, only the metadata file of the highest
+        version number is read.
+
+        Args:
+            model_name (str): The name of the registered model.
+
+        Returns:
+            Optional[Dict]: The metadata dictionary of the latest version, or
+                None if the model is not found or has no versions.
+        """
+        model_path = os.path.join(self._registry_dir, model_name)
+        if not os.path.isdir(model_path):
+            return None
+
+        latest_version = self._get_latest_version_number(model_path)
+        if not latest_version:
+            return None
+
+        meta_path = os.path.join(model_path, str(latest_version), "meta.json")
+        try:
+            with open(meta_path, "rb") as f:
+                return jsonio.loads(f.read())
+        except FileNotFoundError:
+            pass
+
+        # Fall back to the newest version that has metadata
+        for version in sorted(self._list_versions(model_path), reverse=True):
+            meta_path = os.path.join(model_path, str(version), "meta.json")
+            try:
+                with open(meta_path, "rb") as f:
+                    return jsonio.loads(f.read())
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _get_latest_version_number(self, model_path: str) -> int:
+        """Returns the highest version number of a registered model.
+
+        The number is read from the model's `_meta.json`, which
+        `register_model` keeps up to date. The version directories are
+        listed instead if the file is missing, e.g. for models registered by
+        earlier versions, or doesn't match the directories.
+
+        Returns:
+            int: The latest version number, or 0 if there are no versions.
+        """
+        try:
+            with open(os.path.join(model_path, "_meta.json"), "rb") as f:
+                latest_version = jsonio.loads(f.read())["latest_version"]
+            latest_path = os.path.join(model_path, str(latest_version))
+            next_path = os.path.join(model_path, str(latest_version + 1))
+            if os.path.isdir(latest_path) and not os.path.exists(next_path):
+                return latest_version
+        except (FileNotFoundError, jsonio.JSONDecodeError, KeyError, TypeError):
+            pass
+        return max(self._list_versions(model_path), default=0)
+
+    def _list_versions(self, model_path: str) -> List[int]:
+        """Returns the version numbers of a registered model's directory."""
+        with os.scandir(model_path) as entries:
+            return [
+                int(entry.name)
+                for entry in entries
+                if entry.name.isdigit() and entry.is_dir()
+            ]
+
     def get_artifact_abspath(self, run_id: str, artifact_name: str) -> str:
         """
         Gets the absolute path of a specific artifact from a given run.
@@ -1116,27 +2300,57 @@ class RuneLog:
             exceptions.RunNotFound: If the run ID does not exist.
             exceptions.ArtifactNotFound: If the artifact name does not exist in the run.
         """
-        run_details = self.get_run_details(run_id)
-        if not run_details:
+        run_path = self._get_run_path_by_id(run_id)
+        if not run_path:
             raise exceptions.RunNotFound(run_id)
 
-        # Reconstruct the full path
-        exp_id = None
-        for eid in os.listdir(self._mlruns_dir):
-            if os.path.isdir(os.path.join(self._mlruns_dir, eid, run_id)):
-                exp_id = eid
-                break
+        # Only names listed in the artifacts directory are accepted
+        artifacts_path = os.path.join(run_path, "artifacts")
+        try:
+            artifacts = os.listdir(artifacts_path)
+        except FileNotFoundError:
+            artifacts = []
+        if artifact_name not in artifacts:
+            raise exceptions.ArtifactNotFound(artifact_name, run_id)
 
-        artifact_path = os.path.join(
-            self._mlruns_dir, exp_id, run_id, "artifacts", artifact_name
-        )
+        return os.path.join(artifacts_path, artifact_name)
 
-        if artifact_name not in run_details["artifacts"] or not os.path.exists(
-            artifact_path
-        ):
-            raise exceptions.ArtifactNotFound(artifact_name, run_id)
+    @contextmanager
+    def open_artifact(
+        self, run_id: str, artifact_name: str
+    ) -> Generator[mmap.mmap, None, None]:
+        """Memory-maps an artifact of a run for reading.
+
+        The artifact's pages are shared with the OS page cache, so repeated or
+        random reads of a large artifact don't copy it into memory, and
+        processes reading the same artifact share it. The mapping is closed
+        when the context exits.
+
+        Args:
+            run_id (str): The ID of the run containing the artifact.
+            artifact_name (str): The filename of the artifact.
 
-        return artifact_path
+        Yields:
+            mmap.mmap: A read-only mapping of the artifact's contents, which
+                supports slicing and the buffer protocol.
+
+        Raises:
+            exceptions.RunNotFound: If the run ID does not exist.
+            exceptions.ArtifactNotFound: If the artifact name does not exist in the run.
+            ValueError: If the artifact is empty, as empty files can't be mapped.
+
+        Example:
+            >>> with tracker.open_artifact(run_id, "embeddings.npy") as data:
+            ...     header = data[:128]
+        """
+        artifact_path = self.get_artifact_abspath(run_id, artifact_name)
+        with open(artifact_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mapped:
+            if hasattr(mmap, "MADV_WILLNEED"):
+                # Start reading the file ahead of the first page faults
+                mapped.madvise(mmap.MADV_WILLNEED)
+            yield mapped
 
     def download_artifact(
         self, run_id: str, artifact_name: str, destination_path: str = "."
@@ -1157,6 +2371,6 @@ class RuneLog:
         os.makedirs(destination_path, exist_ok=True)
         final_destination = os.path.join(destination_path, artifact_name)
 
-        shutil.copy(source_path, final_destination)
+        self._copy_file(source_path, final_destination)
 
         return os.path.abspath(final_destination)
@@ -1,5 +1,6 @@
 import os
 import sys
+import warnings
 import subprocess
 
 import pytest
@@ -28,6 +29,16 @@ def test_tracker(tmp_path):
     return get_tracker(path=str(tmp_path))
 
 
+def test_help_does_not_initialize_tracker(tmp_path, monkeypatch):
+    """Tests that help output does not create the tracking directories."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["experiments", "--help"])
+
+    assert result.exit_code == 0
+    assert not os.path.exists(tmp_path / ".mlruns")
+    assert not os.path.exists(tmp_path / ".registry")
+
+
 class TestExperimentsCommands:
     def test_list_success(self, test_tracker):
         """Tests that 'experiments list' prints experiments when they exist."""
@@ -206,6 +217,22 @@ class TestRegistryCommands:
         assert result.exit_code == 0
         assert "No models found" in result.stdout
 
+    def test_get_versions_prints_table_once(self, test_tracker):
+        """Tests 'registry get-versions' renders a single table for all versions."""
+        exp_id = test_tracker.get_or_create_experiment("test-get-versions")
+
+        with test_tracker.start_run(experiment_id=exp_id) as run_id:
+            test_tracker.log_model(MockModel(), "model.pkl")
+        for _ in range(3):
+            test_tracker.register_model(run_id, "model.pkl", "versioned-model")
+
+        result = runner.invoke(
+            app, ["registry", "get-versions", "versioned-model"], obj=test_tracker
+        )
+        assert result.exit_code == 0
+        assert result.stdout.count("Versions for") == 1
+        assert result.stdout.count(run_id) == 3
+
     def test_tag_success(self, test_tracker):
         """Tests 'registry tag' can add a tag successfully."""
         exp_id = test_tracker.get_or_create_experiment("test-tags")
@@ -271,4 +298,30 @@ class TestExamplesCommands:
         
         assert call_args[0] == sys.executable
         assert call_args[1] == "-u"
-        assert call_args[2].endswith(expected_script_name)
\ No newline at end of file
+        assert call_args[2].endswith(expected_script_name)
+
+def test_fmt_timestamps_matches_fmt_timestamp(monkeypatch):
+    """Tests that timestamps formatted in one pass are shown in local time."""
+    import time
+    from runelog.cli import _fmt_timestamp, _fmt_timestamps
+
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    try:
+        aware = ["2024-01-01T10:00:00+00:00", "2024-06-01T10:00:00+00:00"]
+        mixed = ["2024-01-01T10:00:00", "2024-01-01T10:00:00+00:00", None]
+
+        assert _fmt_timestamps(aware) == ["2024-01-01 19:00", "2024-06-01 19:00"]
+        assert _fmt_timestamps(mixed) == [_fmt_timestamp(ts) for ts in mixed]
+        assert _fmt_timestamps(mixed) == ["2024-01-01 10:00", "2024-01-01 19:00", None]
+
+        # Values that can't be parsed are shown as they are, without warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert _fmt_timestamps(["not a date", aware[0]]) == [
+                "not a date",
+                "2024-01-01 19:00",
+            ]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
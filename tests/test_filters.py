@@ -0,0 +1,66 @@
+import os
+
+import pytest
+import pandas as pd
+
+from app.filters import filter_columns, filter_runs
+
+
+@pytest.fixture
+def runs():
+    """A small runs table in the format returned by `load_results()`."""
+    return pd.DataFrame(
+        {
+            "status": ["FINISHED", "FAILED", "FINISHED"],
+            "param_alpha": [0.5, 0.1, 0.5],
+            "accuracy": [0.95, 0.7, None],
+            "val-loss": [0.1, 0.4, 0.3],
+            "converged": [True, False, None],
+        },
+        index=pd.Index(["a", "b", "c"], name="run_id"),
+    )
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("accuracy > 0.9 and param_alpha == 0.5", ["a"]),
+        ("0.6 < accuracy < 0.8 or status == 'FINISHED'", ["a", "b", "c"]),
+        ("not converged", ["b", "c"]),
+        ("status in ['FAILED']", ["b"]),
+        ("`val-loss` <= 0.3 and param_alpha > -1", ["a", "c"]),
+    ],
+)
+def test_filter_runs(runs, expression, expected):
+    """Tests that comparisons of columns with constants select matching runs."""
+    assert filter_runs(runs, expression).index.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "accuracy.to_csv('{path}')",
+        "accuracy.values.tofile('{path}')",
+        "__import__('os').system('touch {path}')",
+        "accuracy[0] > 1",
+        "accuracy + 1 > 2",
+        "unknown > 1",
+        "accuracy >",
+    ],
+)
+def test_filter_runs_rejects_other_expressions(runs, tmp_path, expression):
+    """Tests that method calls, attributes and other code are never run."""
+    path = os.path.join(tmp_path, "out")
+
+    with pytest.raises(ValueError):
+        filter_runs(runs, expression.format(path=path))
+    assert not os.path.exists(path)
+
+
+def test_filter_columns(runs):
+    """Tests that the columns a filter refers to are found, quoted or not."""
+    assert filter_columns("`val-loss` < 1 and accuracy > 0.5", runs.columns) == [
+        "accuracy",
+        "val-loss",
+    ]
+    assert filter_columns("accuracy >", runs.columns) == []
@@ -88,3 +88,15 @@ def test_core_api_workflow(tmp_path):
     # Verify latest model is actually the new one
     latest_model = tracker.load_registered_model(model_name, version="latest")
     assert latest_model.val == 456
+
+
+def test_get_tracker_returns_cached_instance(tmp_path):
+    """Tests that get_tracker reuses the instance for a given path."""
+    tracker = get_tracker(path=str(tmp_path))
+
+    assert get_tracker(path=str(tmp_path)) is tracker
+    assert get_tracker(path=str(tmp_path / "other")) is not tracker
+
+    fresh_tracker = get_tracker(path=str(tmp_path), fresh=True)
+    assert fresh_tracker is not tracker
+    assert get_tracker(path=str(tmp_path)) is fresh_tracker
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from runelog import jsonio
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Runs a test with orjson (when installed) and with the json fallback."""
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_write_and_load_round_trip(backend, tmp_path):
+    """Tests that written files load back to the same object."""
+    path = os.path.join(tmp_path, "meta.json")
+    obj = {"run_id": "abc", "status": "FINISHED", "values": [1, 2.5, None]}
+
+    jsonio.write(path, obj)
+
+    with open(path, "rb") as f:
+        assert jsonio.loads(f.read()) == obj
+    assert os.listdir(tmp_path) == ["meta.json"]
+
+
+def test_write_without_indent(backend, tmp_path):
+    """Tests that documents can be written on a single line."""
+    path = os.path.join(tmp_path, "index.json")
+    obj = {"experiments": {"0": {"name": "default"}}, "runs": {}}
+
+    jsonio.write(path, obj, indent=False)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    assert b"\n" not in data and b" " not in data
+    assert jsonio.loads(data) == obj
+
+
+def test_dumps_line_accepts_non_str_keys(backend):
+    """Tests that lines are written for dicts with non-string keys."""
+    data = jsonio.dumps_line({"key": "mapping", "value": {1: "a", 2: "b"}})
+
+    assert data.endswith(b"\n") and data.count(b"\n") == 1
+    assert jsonio.loads(data) == {"key": "mapping", "value": {"1": "a", "2": "b"}}
+
+
+def test_loads_accepts_nan(backend):
+    """Tests that files written by the json module with NaN still load."""
+    data = jsonio.loads(b'{"loss": NaN}')
+
+    assert data["loss"] != data["loss"]
+
+
+def test_loads_invalid_document_raises(backend):
+    """Tests that invalid documents raise jsonio.JSONDecodeError."""
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b"{not json")
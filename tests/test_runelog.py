@@ -5,7 +5,9 @@ import sys
 import json
 import yaml
 import hashlib
+import shutil
 import subprocess
+from datetime import datetime, timedelta
 
 import pandas as pd
 
@@ -34,6 +36,14 @@ def test_initialization(tracker):
     assert os.path.exists(tracker._registry_dir)
 
 
+def test_import_does_not_load_heavy_modules():
+    """Tests that importing runelog defers importing its heavy dependencies."""
+    modules = ["pandas", "joblib", "yaml", "concurrent.futures"]
+    code = f"import sys, runelog; print(*[m in sys.modules for m in {modules!r}])"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.split() == ["False"] * len(modules)
+
+
 def test_get_or_create_experiment(tracker):
     """Tests experiment creation and retrieval."""
     exp_name = "test-get-or-create"
@@ -54,6 +64,144 @@ def test_get_or_create_experiment(tracker):
         assert meta["name"] == exp_name
 
 
+def test_experiments_index(tracker, tmp_path):
+    """Tests that the experiments index is kept in sync and self-heals."""
+    tracker.get_or_create_experiment("exp-a")
+    exp_b = tracker.get_or_create_experiment("exp-b")
+
+    index_path = os.path.join(tracker._mlruns_dir, "index.json")
+    with open(index_path, "r") as f:
+        index = json.load(f)["experiments"]
+    assert [meta["name"] for meta in index.values()] == ["exp-a", "exp-b"]
+
+    # A second tracker sees the deletion and the new experiment
+    tracker.delete_experiment("exp-a")
+    other = RuneLog(path=str(tmp_path))
+    assert [e["name"] for e in other.list_experiments()] == ["exp-b"]
+    assert tracker.get_or_create_experiment("exp-c") != exp_b
+
+    # A missing index is rebuilt from the experiment directories
+    os.remove(index_path)
+    fresh = RuneLog(path=str(tmp_path))
+    names = sorted(e["name"] for e in fresh.list_experiments())
+    assert names == ["exp-b", "exp-c"]
+    assert os.path.exists(index_path)
+
+
+def test_experiment_ids_are_not_reused(tracker, tmp_path):
+    """Tests that deleting the newest experiment doesn't free its ID."""
+    for name in ["exp-a", "exp-b", "exp-c"]:
+        tracker.get_or_create_experiment(name)
+    other = RuneLog(path=str(tmp_path))
+    assert other.get_or_create_experiment("exp-c") == "2"
+
+    tracker.delete_experiment("exp-c")
+    exp_d = tracker.get_or_create_experiment("exp-d")
+    assert exp_d == "3"
+
+    # Trackers that knew the deleted experiment, and new ones, agree
+    assert sorted(e["name"] for e in other.list_experiments()) == [
+        "exp-a",
+        "exp-b",
+        "exp-d",
+    ]
+    assert other.get_or_create_experiment("exp-d") == exp_d
+    with other.start_run(experiment_id=exp_d) as run_id:
+        pass
+    assert tracker.get_run(run_id)["experiment_id"] == exp_d
+
+    other.delete_experiment("exp-d")
+    assert RuneLog(path=str(tmp_path)).get_or_create_experiment("exp-e") == "4"
+
+
+def test_experiment_lookups_read_only_new_metadata(tracker, tmp_path, monkeypatch):
+    """Tests that an up-to-date index is served without opening meta.json files."""
+    for name in ["exp-a", "exp-b"]:
+        tracker.get_or_create_experiment(name)
+
+    other = RuneLog(path=str(tmp_path))
+    reads = []
+    get_experiment = other.get_experiment
+
+    def counting_get_experiment(exp_id):
+        reads.append(exp_id)
+        return get_experiment(exp_id)
+
+    monkeypatch.setattr(other, "get_experiment", counting_get_experiment)
+
+    assert len(other.list_experiments()) == 2
+    assert other.get_or_create_experiment("exp-b") == "1"
+    assert reads == []
+
+    # Only the experiment created by the other tracker is read
+    exp_c = tracker.get_or_create_experiment("exp-c")
+    assert len(other.list_experiments()) == 3
+    assert reads == [exp_c]
+
+
+def test_experiments_index_rereads_changed_metadata(tracker, tmp_path):
+    """Tests that experiments renamed or replaced on disk are read again."""
+    exp_a = tracker.get_or_create_experiment("exp-a")
+    exp_b = tracker.get_or_create_experiment("exp-b")
+    other = RuneLog(path=str(tmp_path))
+    assert other.get_or_create_experiment("exp-a") == exp_a
+
+    # Renamed in place, and replaced by a new directory with the same ID
+    meta_path = os.path.join(tracker._mlruns_dir, exp_a, "meta.json")
+    with open(meta_path, "w") as f:
+        json.dump({"experiment_id": exp_a, "name": "exp-renamed"}, f)
+    exp_b_path = os.path.join(tracker._mlruns_dir, exp_b)
+    shutil.rmtree(exp_b_path)
+    os.makedirs(exp_b_path)
+    with open(os.path.join(exp_b_path, "meta.json"), "w") as f:
+        json.dump({"experiment_id": exp_b, "name": "exp-replaced"}, f)
+
+    for reader in [other, RuneLog(path=str(tmp_path))]:
+        names = {e["experiment_id"]: e["name"] for e in reader.list_experiments()}
+        assert names == {exp_a: "exp-renamed", exp_b: "exp-replaced"}
+        assert reader.get_or_create_experiment("exp-replaced") == exp_b
+
+
+def test_runs_index(tracker, tmp_path):
+    """Tests that runs are located through the index and found without it."""
+    exp_id = tracker.get_or_create_experiment("test-runs-index")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_metric("accuracy", 0.9)
+
+    index_path = os.path.join(tracker._mlruns_dir, "index.json")
+    with open(index_path, "r") as f:
+        assert json.load(f)["runs"] == {run_id: exp_id}
+
+    # Runs missing from the index are still found, and then indexed
+    os.remove(index_path)
+    fresh = RuneLog(path=str(tmp_path))
+    assert fresh.get_run(run_id)["accuracy"] == 0.9
+    with open(index_path, "r") as f:
+        assert json.load(f)["runs"] == {run_id: exp_id}
+
+    fresh.delete_run(run_id)
+    assert fresh.get_run_details(run_id) is None
+    with open(index_path, "r") as f:
+        assert json.load(f)["runs"] == {}
+
+
+def test_listing_runs_indexes_them(tracker, tmp_path):
+    """Tests that runs listed per experiment are added to the runs index."""
+    exp_id = tracker.get_or_create_experiment("test-index-listed-runs")
+    run_ids = []
+    for _ in range(2):
+        with tracker.start_run(experiment_id=exp_id) as run_id:
+            run_ids.append(run_id)
+
+    index_path = os.path.join(tracker._mlruns_dir, "index.json")
+    for list_runs in ["load_results", "get_experiment_runs"]:
+        os.remove(index_path)
+        fresh = RuneLog(path=str(tmp_path))
+        getattr(fresh, list_runs)(exp_id)
+        with open(index_path, "r") as f:
+            assert json.load(f)["runs"] == dict.fromkeys(run_ids, exp_id)
+
+
 def test_start_run_context(tracker):
     """Tests the start_run context manager."""
     exp_id = tracker.get_or_create_experiment("test-context")
@@ -86,20 +234,138 @@ def test_logging_functions(tracker):
 
     with tracker.start_run(experiment_id=exp_id) as run_id:
         # Test param logging
+        # Values are buffered until the run ends or they are flushed
         tracker.log_param("learning_rate", 0.01)
-        param_path = os.path.join(
-            tracker._get_run_path(), "params", "learning_rate.json"
-        )
-        assert os.path.exists(param_path)
+        param_path = os.path.join(tracker._get_run_path(), "params.jsonl")
+        assert os.path.getsize(param_path) == 0
+        tracker.log_param("max_depth", 5, flush=True)
         with open(param_path, "r") as f:
-            assert json.load(f)["value"] == 0.01
+            assert [json.loads(line) for line in f] == [
+                {"key": "learning_rate", "value": 0.01},
+                {"key": "max_depth", "value": 5},
+            ]
 
         # Test metric logging
+        tracker.log_metric("accuracy", 0.9)
         tracker.log_metric("accuracy", 0.95)
-        metric_path = os.path.join(tracker._get_run_path(), "metrics", "accuracy.json")
-        assert os.path.exists(metric_path)
-        with open(metric_path, "r") as f:
-            assert json.load(f)["value"] == 0.95
+        run_path = tracker._get_run_path()
+        assert tracker.get_run(run_id)["accuracy"] == 0.95
+
+    with open(os.path.join(run_path, "metric_names.jsonl"), "r") as f:
+        assert [json.loads(line) for line in f] == [{"key": "accuracy"}]
+    assert os.path.getsize(os.path.join(run_path, "metrics.bin")) == 2 * 28
+    assert not os.path.exists(os.path.join(run_path, "metrics.jsonl"))
+
+    assert tracker.get_run(run_id)["accuracy"] == 0.95
+    history = tracker.get_metric_history(run_id, "accuracy")
+    assert [(entry["step"], entry["value"]) for entry in history] == [
+        (0, 0.9),
+        (1, 0.95),
+    ]
+    assert tracker.get_metric_history(run_id, "missing") == []
+
+
+def test_logging_metric_steps_and_non_numeric_values(tracker):
+    """Tests explicit steps, and metrics that can't be stored as floats."""
+    exp_id = tracker.get_or_create_experiment("test-metric-steps")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_metric("loss", 0.5, step=10)
+        tracker.log_metric("loss", None)
+        tracker.log_metric("loss", 0.25)
+        tracker.log_metric("converged", True)
+        run_path = tracker._get_run_path()
+
+    # A record cut short by a crash is ignored
+    with open(os.path.join(run_path, "metrics.bin"), "ab") as f:
+        f.write(b"\x00" * 5)
+
+    history = tracker.get_metric_history(run_id, "loss")
+    assert [(entry["step"], entry["value"]) for entry in history] == [
+        (10, 0.5),
+        (11, None),
+        (12, 0.25),
+    ]
+    run = tracker.get_run(run_id)
+    assert run["loss"] == 0.25
+    assert run["converged"] is True
+
+
+def test_logging_int_metrics(tracker):
+    """Tests that integer metrics read back as exact integers."""
+    np = pytest.importorskip("numpy")
+    exp_id = tracker.get_or_create_experiment("test-int-metrics")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_metric("loss", 0.5)
+        tracker.log_metric("epoch", 5)
+        tracker.log_metric("samples", 2**53 + 1)
+        tracker.log_metric("batches", np.int64(7))
+
+    details = tracker.get_run_details(run_id)
+    assert details["metrics"] == {
+        "loss": 0.5,
+        "epoch": 5,
+        "samples": 2**53 + 1,
+        "batches": 7,
+    }
+    assert type(details["metrics"]["epoch"]) is int
+    history = tracker.get_metric_history(run_id, "samples")
+    assert [entry["value"] for entry in history] == [2**53 + 1]
+
+
+def test_reading_per_key_value_files(tracker):
+    """Tests that runs with one file per param or metric can still be read."""
+    exp_id = tracker.get_or_create_experiment("test-legacy-layout")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        run_path = tracker._get_run_path()
+
+    for kind, key, value in [("params", "alpha", 0.5), ("metrics", "accuracy", 0.9)]:
+        os.makedirs(os.path.join(run_path, kind))
+        with open(os.path.join(run_path, kind, f"{key}.json"), "w") as f:
+            json.dump({"value": value}, f)
+
+    details = tracker.get_run_details(run_id)
+    assert details["params"] == {"alpha": 0.5}
+    assert details["metrics"] == {"accuracy": 0.9}
+
+    run = tracker.get_run(run_id)
+    assert run["param_alpha"] == 0.5
+    assert run["accuracy"] == 0.9
+
+    # Runs with a single params.json and metrics.json file
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        run_path = tracker._get_run_path()
+    for kind, values in [("params", {"alpha": 0.1}), ("metrics", {"accuracy": 0.7})]:
+        with open(os.path.join(run_path, f"{kind}.json"), "w") as f:
+            json.dump(values, f)
+
+    run = tracker.get_run(run_id)
+    assert run["param_alpha"] == 0.1
+    assert run["accuracy"] == 0.7
+
+
+def test_logging_numpy_values(tracker):
+    """Tests that numpy scalars can be logged as params and metrics."""
+    np = pytest.importorskip("numpy")
+    exp_id = tracker.get_or_create_experiment("test-logging-numpy")
+
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_param("n_estimators", np.int64(100))
+        tracker.log_metric("accuracy", np.float64(0.95))
+
+    run = tracker.get_run(run_id)
+    assert run["param_n_estimators"] == 100
+    assert run["accuracy"] == 0.95
+
+
+def test_logging_dict_param_with_int_keys(tracker):
+    """Tests that dict params with non-string keys are logged like json does."""
+    exp_id = tracker.get_or_create_experiment("test-logging-int-keys")
+
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_param("class_names", {0: "cat", 1: "dog"})
+
+    details = tracker.get_run_details(run_id)
+    assert details["params"] == {"class_names": {"0": "cat", "1": "dog"}}
 
 
 def test_log_artifact_and_model(tracker):
@@ -128,6 +394,49 @@ def test_log_artifact_and_model(tracker):
         assert os.path.exists(logged_model_path)
 
 
+@pytest.mark.parametrize("copy_file_range", ["native", "unsupported"])
+def test_log_artifact_copies_contents(tracker, monkeypatch, copy_file_range):
+    """Tests that artifacts are copied with and without os.copy_file_range."""
+    if copy_file_range == "unsupported":
+
+        def unsupported(*args):
+            raise OSError("copy_file_range is not supported")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+
+    data = os.urandom(3 * 1024 * 1024)
+    source_path = os.path.join(tracker.root_path, "weights.bin")
+    with open(source_path, "wb") as f:
+        f.write(data)
+
+    exp_id = tracker.get_or_create_experiment("test-artifact-copy")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_artifact(source_path)
+
+    with open(tracker.get_artifact_abspath(run_id, "weights.bin"), "rb") as f:
+        assert f.read() == data
+
+
+def test_open_artifact(tracker):
+    """Tests that artifacts can be read through a memory map."""
+    source_path = os.path.join(tracker.root_path, "data.txt")
+    with open(source_path, "wb") as f:
+        f.write(b"hello world")
+
+    exp_id = tracker.get_or_create_experiment("test-open-artifact")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_artifact(source_path)
+
+    with tracker.open_artifact(run_id, "data.txt") as data:
+        assert data[:5] == b"hello"
+        assert len(data) == 11
+    assert data.closed
+
+    with pytest.raises(exceptions.ArtifactNotFound):
+        with tracker.open_artifact(run_id, "missing.txt"):
+            pass
+
+
 def test_model_registry_workflow(tracker):
     """Tests the full model registry workflow."""
     exp_id = tracker.get_or_create_experiment("test-registry-workflow")
@@ -158,6 +467,128 @@ def test_model_registry_workflow(tracker):
     tags = tracker.get_model_tags(model_name, "2")
     assert tags["status"] == "production"
 
+    # Registration times are recorded in UTC
+    latest = tracker.get_latest_model_version(model_name)
+    registered = datetime.fromisoformat(latest["registration_timestamp"])
+    assert registered.utcoffset() == timedelta(0)
+
+
+def test_registered_model_unaffected_by_relogging(tracker):
+    """Tests that logging an artifact again doesn't change registered versions."""
+    exp_id = tracker.get_or_create_experiment("test-registry-relog")
+    model_name = "relogged-model"
+
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(val=1), "model.pkl")
+        tracker.register_model(run_id, "model.pkl", model_name)
+        tracker.log_model(MockModel(val=2), "model.pkl")
+        tracker.register_model(run_id, "model.pkl", model_name)
+
+    assert tracker.load_registered_model(model_name, version="1").val == 1
+    assert tracker.load_registered_model(model_name, version="2").val == 2
+    artifacts = tracker.get_run_details(run_id)["artifacts"]
+    assert not [name for name in artifacts if name.startswith(".")]
+
+
+def test_load_model_with_mmap(tracker):
+    """Tests that logged and registered models can be memory-mapped."""
+    np = pytest.importorskip("numpy")
+    exp_id = tracker.get_or_create_experiment("test-registry-mmap")
+
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(val=np.arange(1000.0)), "model.pkl")
+    tracker.register_model(run_id, "model.pkl", "mmap-model")
+
+    model = tracker.load_registered_model("mmap-model", mmap_mode="r")
+    assert isinstance(model.val, np.memmap)
+    assert model.val.sum() == np.arange(1000.0).sum()
+
+    model = tracker.load_model(run_id, "model.pkl", mmap_mode="r")
+    assert isinstance(model.val, np.memmap)
+    with pytest.raises(exceptions.ArtifactNotFound):
+        tracker.load_model(run_id, "missing.pkl")
+
+
+def test_get_latest_model_version(tracker):
+    """Tests that only the newest registered version is returned."""
+    assert tracker.get_latest_model_version("nonexistent-model") is None
+
+    exp_id = tracker.get_or_create_experiment("test-latest-version")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(), "model.pkl")
+
+    model_name = "latest-version-model"
+    for _ in range(10):
+        tracker.register_model(run_id, "model.pkl", model_name)
+
+    latest = tracker.get_latest_model_version(model_name)
+    assert latest["version"] == "10"
+    assert latest["source_run_id"] == run_id
+    assert latest == tracker.get_model_versions(model_name)[0]
+
+
+def test_latest_version_metadata(tracker):
+    """Tests that the latest version is tracked in the model's _meta.json."""
+    exp_id = tracker.get_or_create_experiment("test-latest-meta")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(val=1), "model.pkl")
+
+    model_name = "latest-meta-model"
+    tracker.register_model(run_id, "model.pkl", model_name)
+    tracker.register_model(run_id, "model.pkl", model_name)
+
+    model_path = os.path.join(tracker._registry_dir, model_name)
+    with open(os.path.join(model_path, "_meta.json"), "r") as f:
+        assert json.load(f)["latest_version"] == 2
+    assert tracker.list_registered_models() == [model_name]
+
+    # Models without the file fall back to listing their versions
+    os.remove(os.path.join(model_path, "_meta.json"))
+    assert tracker.get_latest_model_version(model_name)["version"] == "2"
+    assert tracker.register_model(run_id, "model.pkl", model_name) == "3"
+    assert tracker.load_registered_model(model_name).val == 1
+
+
+def test_get_model_versions_reflects_registry_changes(tracker):
+    """Tests that cached model versions are invalidated by registry writes."""
+    exp_id = tracker.get_or_create_experiment("test-versions-cache")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(), "model.pkl")
+
+    model_name = "cached-versions-model"
+    tracker.register_model(run_id, "model.pkl", model_name)
+    versions = tracker.get_model_versions(model_name)
+    assert [v["version"] for v in versions] == ["1"]
+
+    # Mutating the returned data must not affect the cache
+    versions[0]["tags"]["mutated"] = True
+
+    tracker.add_model_tags(model_name, "1", {"status": "staging"})
+    assert tracker.get_model_versions(model_name)[0]["tags"] == {"status": "staging"}
+
+    tracker.register_model(run_id, "model.pkl", model_name)
+    versions = tracker.get_model_versions(model_name, ascending=True)
+    assert [v["version"] for v in versions] == ["1", "2"]
+
+    # Tags added by another tracker, e.g. in another process, are seen too
+    other = RuneLog(path=tracker.root_path)
+    other.add_model_tags(model_name, "1", {"status": "production"})
+    versions = tracker.get_model_versions(model_name, ascending=True)
+    assert versions[0]["tags"] == {"status": "production"}
+
+
+def test_get_model_versions_sorts_numerically(tracker):
+    """Tests that versions are ordered by number, not as strings."""
+    exp_id = tracker.get_or_create_experiment("test-versions-order")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_model(MockModel(), "model.pkl")
+
+    for _ in range(11):
+        tracker.register_model(run_id, "model.pkl", "many-versions-model")
+
+    versions = tracker.get_model_versions("many-versions-model")
+    assert [int(v["version"]) for v in versions] == list(range(11, 0, -1))
+
 
 def test_logging_outside_active_run_raises_error(tracker):
     """
@@ -183,6 +614,175 @@ def test_load_results_on_empty_experiment(tracker):
     assert results.empty
 
 
+def test_load_results_fills_missing_values(tracker):
+    """Tests that keys logged by only some runs are NaN for the others."""
+    exp_id = tracker.get_or_create_experiment("test-missing-values")
+
+    with tracker.start_run(experiment_id=exp_id) as first_run:
+        tracker.log_metric("accuracy", 0.8)
+    with tracker.start_run(experiment_id=exp_id) as second_run:
+        tracker.log_param("alpha", 0.1)
+        tracker.log_metric("loss", 0.2)
+
+    results = tracker.load_results(exp_id)
+
+    assert results.index.name == "run_id"
+    assert len(results) == 2
+    assert pd.isna(results.loc[first_run, "param_alpha"])
+    assert pd.isna(results.loc[first_run, "loss"])
+    assert pd.isna(results.loc[second_run, "accuracy"])
+    assert results.loc[second_run, "param_alpha"] == 0.1
+
+
+def test_load_results_with_columns(tracker):
+    """Tests that load_results only returns the requested columns."""
+    exp_id = tracker.get_or_create_experiment("test-columns")
+
+    for alpha, accuracy in [(0.1, 0.8), (0.5, 0.9)]:
+        with tracker.start_run(experiment_id=exp_id):
+            tracker.log_param("alpha", alpha)
+            tracker.log_param("solver", "lbfgs")
+            tracker.log_metric("accuracy", accuracy)
+            tracker.log_metric("loss", 1 - accuracy)
+
+    results = tracker.load_results(
+        exp_id, sort_by="loss", columns=["accuracy", "param_alpha", "missing"]
+    )
+
+    assert list(results.columns) == ["accuracy", "param_alpha"]
+    assert results["accuracy"].tolist() == [0.9, 0.8]
+
+
+def test_load_results_with_results_summary(tracker):
+    """
+    Tests that load_results indexes finished runs in the experiment's summary
+    file and merges it with runs not yet summarized.
+    """
+    pytest.importorskip("pyarrow")
+    exp_id = tracker.get_or_create_experiment("test-summary")
+
+    with tracker.start_run(experiment_id=exp_id) as run_1:
+        tracker.log_metric("accuracy", 0.8)
+    with tracker.start_run(experiment_id=exp_id) as run_2:
+        tracker.log_param("alpha", 0.5)
+        tracker.log_metric("accuracy", 0.9)
+
+    # Finishing a run doesn't write the summary, loading results does
+    summary_path = os.path.join(tracker._mlruns_dir, exp_id, "runs.parquet")
+    assert not os.path.exists(summary_path)
+    tracker.load_results(exp_id)
+    assert os.path.exists(summary_path)
+
+    tracker.delete_run(run_1)
+
+    with tracker.start_run(experiment_id=exp_id) as run_3:
+        tracker.log_metric("accuracy", 0.7)
+        results = tracker.load_results(exp_id)
+
+    assert set(results.index) == {run_2, run_3}
+    assert results.loc[run_2, "param_alpha"] == 0.5
+    assert results.loc[run_3, "accuracy"] == 0.7
+    assert results.loc[run_3, "status"] == "RUNNING"
+
+
+def test_results_summary_falls_back_on_mixed_types(tracker, monkeypatch):
+    """
+    Tests that values that can't share a column type are still summarized,
+    so later load_results calls don't read every run again.
+    """
+    pytest.importorskip("pyarrow")
+    exp_id = tracker.get_or_create_experiment("test-summary-mixed")
+
+    with tracker.start_run(experiment_id=exp_id):
+        tracker.log_param("solver", 1)
+    with tracker.start_run(experiment_id=exp_id):
+        tracker.log_param("solver", "lbfgs")
+
+    summary_path = os.path.join(tracker._mlruns_dir, exp_id, "runs.parquet")
+    assert not os.path.exists(summary_path)
+
+    results = tracker.load_results(exp_id)
+    assert sorted(results["param_solver"].astype(str)) == ["1", "lbfgs"]
+    assert os.path.exists(summary_path)
+
+    reads = []
+    read_run = tracker._read_run
+    monkeypatch.setattr(
+        tracker, "_read_run", lambda *args: reads.append(args) or read_run(*args)
+    )
+    summarized = tracker.load_results(exp_id)
+    assert reads == []
+    pd.testing.assert_frame_equal(summarized, results)
+    assert sorted(summarized["param_solver"], key=str) == [1, "lbfgs"]
+
+
+def test_load_results_reads_runs_in_parallel(tracker):
+    """Tests that runs read from their directories are all loaded correctly."""
+    exp_id = tracker.get_or_create_experiment("test-parallel-load")
+
+    run_ids = {}
+    for i in range(20):
+        with tracker.start_run(experiment_id=exp_id) as run_id:
+            tracker.log_param("index", i)
+            tracker.log_metric("score", i / 10)
+        run_ids[run_id] = i
+
+    # Without the summary every run is read from its own files
+    summary_path = os.path.join(tracker._mlruns_dir, exp_id, "runs.parquet")
+    if os.path.exists(summary_path):
+        os.remove(summary_path)
+
+    results = tracker.load_results(exp_id)
+    assert set(results.index) == set(run_ids)
+    for run_id, i in run_ids.items():
+        assert results.loc[run_id, "param_index"] == i
+        assert results.loc[run_id, "score"] == i / 10
+
+    os.remove(summary_path)
+    pd.testing.assert_frame_equal(tracker.load_results(exp_id, parallel=False), results)
+
+
+def test_load_results_adds_missing_runs_to_summary(tracker, monkeypatch):
+    """Tests that finished runs missing from the summary are read only once."""
+    pytest.importorskip("pyarrow")
+    exp_id = tracker.get_or_create_experiment("test-summary-backfill")
+    for i in range(3):
+        with tracker.start_run(experiment_id=exp_id):
+            tracker.log_metric("score", i)
+
+    summary_path = os.path.join(tracker._mlruns_dir, exp_id, "runs.parquet")
+    results = tracker.load_results(exp_id)
+    assert os.path.exists(summary_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("run read from disk")
+
+    monkeypatch.setattr(tracker, "_read_run", fail)
+    pd.testing.assert_frame_equal(tracker.load_results(exp_id), results)
+
+
+def test_results_summary_matches_run_files(tracker):
+    """Tests that summarized runs load the same values as runs read from disk."""
+    pytest.importorskip("pyarrow")
+    exp_id = tracker.get_or_create_experiment("test-summary-round-trip")
+    with tracker.start_run(experiment_id=exp_id):
+        tracker.set_run_tags({"team": "vision"})
+        tracker.log_param("layers", [64, 32])
+        tracker.log_param("solver", "adam")
+    with tracker.start_run(experiment_id=exp_id):
+        tracker.set_run_tags({"stage": "dev"})
+        tracker.log_param("layers", (128,))
+
+    from_disk = tracker.load_results(exp_id)
+    from_summary = tracker.load_results(exp_id)
+    assert os.path.exists(os.path.join(tracker._mlruns_dir, exp_id, "runs.parquet"))
+
+    pd.testing.assert_frame_equal(from_summary, from_disk)
+    tags = from_summary["tags"].tolist()
+    assert {"team": "vision"} in tags and {"stage": "dev"} in tags
+    assert sorted(from_summary["param_layers"].tolist()) == [[64, 32], [128]]
+
+
 def test_log_nonexistent_artifact_raises_error(tracker):
     """
     Tests that trying to log an artifact from a path that does not
@@ -217,6 +817,11 @@ def test_registry_loading_edge_cases(tracker):
     with pytest.raises(exceptions.ModelVersionNotFound):
         tracker.load_registered_model(model_name, version="99")
 
+    # Registering a missing artifact leaves the registry untouched
+    with pytest.raises(exceptions.ArtifactNotFound):
+        tracker.register_model(run_id, "missing.pkl", "missing-model")
+    assert tracker.list_registered_models() == [model_name]
+
 
 def test_get_run_details_for_nonexistent_run(tracker):
     """
@@ -226,6 +831,38 @@ def test_get_run_details_for_nonexistent_run(tracker):
     assert tracker.get_run_details("nonexistent_run_id") is None
 
 
+def test_run_reads_are_cached_until_the_run_changes(tracker):
+    """
+    Tests that repeated get_run_details calls reuse the cached result, and
+    that changes to the run directory are picked up.
+    """
+    exp_id = tracker.get_or_create_experiment("test-run-cache")
+    with tracker.start_run(experiment_id=exp_id) as run_id:
+        tracker.log_metric("accuracy", 0.9)
+        assert tracker.get_run_details(run_id)["metrics"] == {"accuracy": 0.9}
+        tracker.log_metric("loss", 0.1)
+        assert tracker.get_run(run_id)["loss"] == 0.1
+
+    details = tracker.get_run_details(run_id)
+    assert details["meta"]["status"] == "FINISHED"
+    details["metrics"]["accuracy"] = 0.0
+
+    reads = []
+    read_run_details = tracker._read_run_details
+    tracker._read_run_details = lambda *args: reads.append(args) or read_run_details(*args)
+
+    assert tracker.get_run_details(run_id)["metrics"]["accuracy"] == 0.9
+    assert reads == []
+
+    # Another process adds an artifact to the finished run
+    run_path = tracker._get_run_path_by_id(run_id)
+    with open(os.path.join(run_path, "artifacts", "notes.txt"), "w") as f:
+        f.write("notes")
+
+    assert "notes.txt" in tracker.get_run_details(run_id)["artifacts"]
+    assert len(reads) == 1
+
+
 def test_delete_experiment_success(tracker):
     """Tests that a specific experiment can be successfully deleted."""
     exp_name = "experiment-to-delete"
@@ -258,6 +895,33 @@ def test_delete_run_success(tracker):
     assert not os.path.exists(run_path)
 
 
+def test_deleted_directories_are_removed_in_background(tracker):
+    """Tests that deletions leave no trace in listings once they finish."""
+    experiment_id = tracker.get_or_create_experiment("test-delete-trash")
+    with tracker.start_run(experiment_id=experiment_id) as run_id:
+        tracker.log_metric("loss", 0.5)
+
+    tracker.delete_run(run_id)
+    tracker.delete_experiment(experiment_id)
+    RuneLog._delete_executor.submit(lambda: None).result()
+
+    assert tracker.list_experiments() == []
+    assert os.listdir(os.path.join(tracker._mlruns_dir, ".trash")) == []
+
+
+def test_default_experiment_recreated_after_deletion(tracker):
+    """Tests that runs without an experiment recreate a deleted default one."""
+    with tracker.start_run():
+        pass
+    tracker.delete_experiment("0")
+
+    with tracker.start_run() as run_id:
+        pass
+
+    assert tracker.get_experiment("0")["name"] == "default-experiment"
+    assert tracker.get_run(run_id) is not None
+
+
 def test_delete_nonexistent_run_raises_error(tracker):
     """Tests that deleting a non-existent run raises an error."""
     with pytest.raises(exceptions.RunNotFound):
@@ -271,14 +935,15 @@ def test_log_git_metadata_success(tracker, monkeypatch):
 
     def mock_subprocess(args):
         if "rev-parse" in args and "--abbrev-ref" in args:
-            return b"mock_branch\n"
-        if "rev-parse" in args and "HEAD" in args:
-            return b"mock_commit_hash\n"
-        if "status" in args:
-            return b""  # empty bytes means a clean repo
+            return b"mock_commit_hash\nmock_branch\n"
         return b""
 
+    def mock_run(args, **kwargs):
+        # Exit code 0 means a clean repo
+        return subprocess.CompletedProcess(args, 0)
+
     monkeypatch.setattr(subprocess, "check_output", mock_subprocess)
+    monkeypatch.setattr(subprocess, "run", mock_run)
 
     with tracker.start_run(experiment_name="git-test"):
         tracker._log_git_metadata()
@@ -298,11 +963,14 @@ def test_log_git_metadata_dirty_repo(tracker, monkeypatch):
     """
 
     def mock_subprocess(args):
-        if "status" in args:
-            return b"M modified_file.py\n"  # non-empty bytes means a dirty repo
-        return b"mock_data\n"
+        return b"mock_commit_hash\nmock_branch\n"
+
+    def mock_run(args, **kwargs):
+        # Exit code 1 means tracked files differ from HEAD
+        return subprocess.CompletedProcess(args, 1 if "diff" in args else 0)
 
     monkeypatch.setattr(subprocess, "check_output", mock_subprocess)
+    monkeypatch.setattr(subprocess, "run", mock_run)
 
     with tracker.start_run(experiment_name="git-dirty-test"):
         tracker._log_git_metadata()
@@ -341,6 +1009,18 @@ def test_log_environment_success(tracker, monkeypatch):
         with open(artifact_path, "r") as f:
             assert f.read() == mock_pip_output.decode().strip()
 
+    # Later runs reuse the captured output instead of running pip again
+    def mock_subprocess_no_pip(args):
+        assert "pip" not in args
+        return b""
+
+    monkeypatch.setattr(subprocess, "check_output", mock_subprocess_no_pip)
+    with tracker.start_run(experiment_name="env-test"):
+        tracker._log_environment()
+        json_path = os.path.join(tracker._get_run_path(), "environment.json")
+        with open(json_path, "r") as f:
+            assert json.load(f)["packages"]["pandas"] == "1.5.0"
+
 
 def test_log_environment_failure(tracker, monkeypatch):
     """